@@ -14,10 +14,29 @@ What changed from old dashboard.py:
   • Same scripts/     folder — nothing inside it was changed
 """
 
-import os, sys, json, uuid, time, threading, csv, re
+import os, sys, json, time, threading, csv, re, io, zipfile, itertools, mimetypes, shutil, struct
+import hashlib, multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
 from pathlib import Path
 from datetime import datetime
-from flask import Flask, render_template, request, jsonify, send_from_directory
+from urllib.parse import quote as url_quote
+from flask import Flask, Response, abort, render_template, request, jsonify, send_from_directory
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.security import safe_join
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+try:
+    from waitress import serve as waitress_serve
+except Exception:
+    waitress_serve = None
 
 try:
     from googletrans import Translator
@@ -42,11 +61,13 @@ except Exception as e:
 
 try:
     from image_generator import QuoteImageGenerator
+    from PIL import __version__ as PIL_VERSION
     IMAGE_GEN_OK = True
 except Exception as e:
     print(f"[WARN] image_generator: {e}")
     IMAGE_GEN_OK = False
     QuoteImageGenerator = None
+    PIL_VERSION = None
 
 try:
     from google_drive_uploader import DriveUploader
@@ -64,7 +85,33 @@ APP_VERSION_UNIFIED = "2.0.0"
 
 # ── Flask app ─────────────────────────────────────────────────────────────────
 app = Flask(__name__, template_folder="templates")
-app.config["JSON_SORT_KEYS"] = False
+# JSON_SORT_KEYS has been ignored since Flask 2.3 — set it on the provider
+app.json.sort_keys = False
+# Behind Apache/nginx with X-Sendfile enabled, hand file bodies to the proxy
+# instead of streaming them through a Flask worker
+app.config["USE_X_SENDFILE"] = os.environ.get("USE_X_SENDFILE", "").strip().lower() in ("1", "true", "yes")
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """jsonify/get_json through orjson — job status with a long results list
+    is serialised on every poll"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # orjson already produces bytes: skip the decode/re-encode round trip
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default,
+                            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+if orjson is not None:
+    app.json = ORJSONProvider(app)
 
 # ── Singleton components ──────────────────────────────────────────────────────
 _sheet = None
@@ -103,35 +150,131 @@ def get_drive() -> "DriveUploader | None":
     return _drive
 
 
+_WS_RE         = re.compile(r"\s+")
+_DASH_SPLIT_RE = re.compile(r"\s*[-—]+\s*")
+_AUTH_CLEAN_RE = re.compile(r"[=,\.\-]+")
+_LIKES_RE      = re.compile(r"([\d,]*)\s*likes")  # "172,117 likes"
+# Matched against the raw class attribute while parsing ("quote mediumText"),
+# so a plain class_="quote" would miss multi-class tags
+_SCRAPE_KEEP_RE = re.compile(r"(?:^|\s)(?:quote|next_page)(?:\s|$)")
+
+
+@lru_cache(maxsize=4096)
+def _author_suffix_re(a_cmp: str) -> "re.Pattern[str]":
+    return re.compile(rf"{re.escape(a_cmp)}$", re.IGNORECASE)
+
+
 def _sanitize_quote_author(quote: str, author: str) -> str:
     q = str(quote or '').strip()
     a = str(author or '').strip()
     if not q or not a:
         return q
-    q_cmp = re.sub(r"\s+", " ", q).strip().lower()
-    a_cmp = re.sub(r"\s+", " ", a).strip().lower()
-
-    # Common patterns where author is appended at end of quote text
-    patterns = [
-        rf"{re.escape(a_cmp)}$",
-        rf"[-—–]\s*{re.escape(a_cmp)}$",
-        rf"\"\s*{re.escape(a_cmp)}$",
-        rf"\"\s*[-—–]\s*{re.escape(a_cmp)}$",
-    ]
-    for p in patterns:
-        if re.search(p, q_cmp, flags=re.IGNORECASE):
-            q = re.sub(p, "", q, flags=re.IGNORECASE).rstrip(" \t\r\n\"-—–")
-            break
+    # Most quotes don't end with the author at all: if the text doesn't even
+    # end with the author's last word, skip the whitespace normalisation
+    a_last = a.rsplit(None, 1)[-1].lower()
+    if not q[-len(a_last):].lower().endswith(a_last):
+        return q
+    q_cmp = _WS_RE.sub(" ", q).strip().lower()
+    a_cmp = _WS_RE.sub(" ", a).strip().lower()
+
+    # Author appended at the end of the quote text, optionally after a dash
+    # and/or closing quote — those separators are covered by the rstrip.
+    # Both sides are lower-cased already, so endswith is the cheap test; the
+    # regex only runs (on the original text) when there is something to cut.
+    if q_cmp.endswith(a_cmp):
+        q = _author_suffix_re(a_cmp).sub("", q).rstrip(" \t\r\n\"-—–")
     return q.strip()
 
 # ── Job tracker ───────────────────────────────────────────────────────────────
-JOBS: dict[str, dict] = {}
+class JobStore:
+    """Job state shared between request threads and background workers.
+
+    Every read and write goes through one lock, so a status poll never sees a
+    half-applied update (e.g. a new message with the previous progress).
+    Holds at most max_jobs entries: the oldest finished jobs are dropped
+    first, running jobs are never evicted.
+
+    State lives in this process only: serve the app from a single process
+    (threads are fine) or status polls may land where the job isn't.
+    """
+
+    def __init__(self, max_jobs: int = 256):
+        self._jobs: dict[str, dict] = {}  # insertion order = age
+        self._revs: dict[str, int] = {}   # bumped on every update, for watch()
+        self._lock = threading.Condition()
+        self._max_jobs = max_jobs
+
+    def start(self, job_id: str, state: dict):
+        # Copy before taking the lock so the critical section is one store
+        state = dict(state)
+        with self._lock:
+            self._jobs[job_id] = state
+            self._revs[job_id] = 0
+            if len(self._jobs) > self._max_jobs:
+                self._evict()
+
+    def _evict(self):
+        excess = len(self._jobs) - self._max_jobs
+        for jid in [j for j, s in self._jobs.items() if s.get("status") != "running"][:excess]:
+            del self._jobs[jid]
+            del self._revs[jid]
+
+    def update(self, job_id: str, **fields):
+        with self._lock:
+            s = self._jobs.get(job_id)
+            if s is not None:
+                s.update(fields)
+                self._revs[job_id] += 1
+                self._lock.notify_all()
+
+    def get(self, job_id: str) -> dict | None:
+        """Snapshot of a job's state, or None if unknown"""
+        with self._lock:
+            s = self._jobs.get(job_id)
+            return dict(s) if s is not None else None
+
+    def get_versioned(self, job_id: str) -> tuple[int, dict | None]:
+        """(revision, snapshot) read under one lock; snapshot is None if unknown"""
+        with self._lock:
+            s = self._jobs.get(job_id)
+            return self._revs.get(job_id, -1), (dict(s) if s is not None else None)
+
+    def watch(self, job_id: str, rev: int = -1, timeout: float = 15.0) -> tuple[int, dict | None]:
+        """Block until the job's revision differs from rev (or timeout).
+
+        Returns (revision, snapshot); snapshot is None for an unknown job.
+        """
+        with self._lock:
+            self._lock.wait_for(lambda: self._revs.get(job_id, rev) != rev, timeout)
+            s = self._jobs.get(job_id)
+            return self._revs.get(job_id, -1), (dict(s) if s is not None else None)
+
+
+JOBS = JobStore()
+
+# Job ids only need to be unique within this process (JOBS is in-memory); a
+# pid prefix keeps ids from a restarted server from colliding in open tabs.
+_JOB_PREFIX  = f"{os.getpid():x}"
+_job_counter = itertools.count(1)
+
+def _new_job_id() -> str:
+    return f"{_JOB_PREFIX}-{next(_job_counter):x}"
+# Generation jobs run off the request thread on one persistent worker: the
+# shared QuoteImageGenerator keeps per-call state (font, sizes) and must not
+# be driven by two jobs at once. Queued jobs wait their turn.
+JOB_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="job")
+# The executor's own queue is unbounded; cap running + queued jobs so repeated
+# clicks can't pile up work (and payloads) without limit
+JOB_QUEUE_DEPTH = max(1, int(os.environ.get("JOB_QUEUE_DEPTH", "8") or 8))
+_job_slots = threading.BoundedSemaphore(JOB_QUEUE_DEPTH)
 
 # ── Scrape state ──────────────────────────────────────────────────────────────
 SCRAPE_LOG    = []
 SCRAPE_ACTIVE = threading.Event()
+_scrape_claim = threading.Lock()  # check-and-set for SCRAPE_ACTIVE across request threads
 EXPORT_DIR    = BASE_DIR / "Export"
-EXPORT_DIR.mkdir(exist_ok=True)
+if not EXPORT_DIR.is_dir():
+    EXPORT_DIR.mkdir(parents=True, exist_ok=True)
 
 # ── Goodreads categories ──────────────────────────────────────────────────────
 CATEGORIES = [
@@ -168,44 +311,76 @@ CSV_HEADER = ["SNO","THUMB","CATEGORY","AUTHOR","QUOTE","TRANSLATE","TAGS","LIKE
 #  MAIN PAGE
 # ══════════════════════════════════════════════════════════════════════════════
 
+STYLES = (
+    {"id":"elegant",          "label":"Elegant",       "icon":"✨"},
+    {"id":"modern",           "label":"Modern",        "icon":"🔷"},
+    {"id":"neon",             "label":"Neon",          "icon":"🧿"},
+    {"id":"vintage",          "label":"Vintage",       "icon":"📜"},
+    {"id":"minimalist_dark",  "label":"Dark Minimal",  "icon":"🌑"},
+    {"id":"creative_split",   "label":"Split",         "icon":"🎭"},
+    {"id":"geometric",        "label":"Geometric",     "icon":"🔺"},
+    {"id":"artistic",         "label":"Artistic",      "icon":"🎨"},
+    {"id":"gradient_sunset",  "label":"Sunset",        "icon":"🌅"},
+    {"id":"nature",           "label":"Nature",        "icon":"🌿"},
+    {"id":"ocean",            "label":"Ocean",         "icon":"🌊"},
+    {"id":"cosmic",           "label":"Cosmic",        "icon":"🌌"},
+)
+
 @app.route("/")
 def index():
-    styles = [
-        {"id":"elegant",          "label":"Elegant",       "icon":"✨"},
-        {"id":"modern",           "label":"Modern",        "icon":"🔷"},
-        {"id":"neon",             "label":"Neon",          "icon":"🧿"},
-        {"id":"vintage",          "label":"Vintage",       "icon":"📜"},
-        {"id":"minimalist_dark",  "label":"Dark Minimal",  "icon":"🌑"},
-        {"id":"creative_split",   "label":"Split",         "icon":"🎭"},
-        {"id":"geometric",        "label":"Geometric",     "icon":"🔺"},
-        {"id":"artistic",         "label":"Artistic",      "icon":"🎨"},
-        {"id":"gradient_sunset",  "label":"Sunset",        "icon":"🌅"},
-        {"id":"nature",           "label":"Nature",        "icon":"🌿"},
-        {"id":"ocean",            "label":"Ocean",         "icon":"🌊"},
-        {"id":"cosmic",           "label":"Cosmic",        "icon":"🌌"},
-    ]
     return render_template("index.html",
         app_version = APP_VERSION_UNIFIED,
         categories  = CATEGORIES,
-        styles      = styles,
+        styles      = STYLES,
     )
 
 # ══════════════════════════════════════════════════════════════════════════════
 #  STATS
 # ══════════════════════════════════════════════════════════════════════════════
 
+# The dashboard polls /api/stats; a directory's mtime changes whenever a
+# file is added, removed or renamed in it, so counts are reused until then.
+_DIR_COUNT_CACHE: dict[tuple[Path, tuple[str, ...]], tuple[int, int]] = {}
+
+def _count_files(folder: Path, suffixes: tuple[str, ...]) -> int:
+    try:
+        mtime = folder.stat().st_mtime_ns
+    except OSError:
+        return 0
+    key = (folder, suffixes)
+    hit = _DIR_COUNT_CACHE.get(key)
+    if hit and hit[0] == mtime:
+        return hit[1]
+    with os.scandir(folder) as it:
+        n = sum(1 for e in it if e.name.endswith(suffixes))
+    _DIR_COUNT_CACHE[key] = (mtime, n)
+    return n
+
+
+# Topic list for the stats card: a Sheets round-trip, so at most once a minute
+STATS_TOPICS_TTL = 60.0
+_stats_topics_cache = {"t": 0.0, "id": None, "topics": []}
+
+def _stats_topics(sr) -> list:
+    c, now = _stats_topics_cache, time.monotonic()
+    sid = getattr(sr.spreadsheet, "id", None)
+    if c["id"] == sid and now - c["t"] < STATS_TOPICS_TTL:
+        return c["topics"]
+    try:
+        topics = sr.get_all_topics()
+    except Exception:
+        return []
+    c.update(t=now, id=sid, topics=topics)
+    return topics
+
+
 @app.route("/api/stats")
 def api_stats():
-    gen_dir = BASE_DIR / "Generated_Images"
-    imgs = len(list(gen_dir.glob("*.png"))) + len(list(gen_dir.glob("*.jpg"))) \
-           if gen_dir.exists() else 0
-    csv_count = len(list(EXPORT_DIR.glob("*.csv"))) if EXPORT_DIR.exists() else 0
+    imgs      = _count_files(BASE_DIR / "Generated_Images", (".png", ".jpg"))
+    csv_count = _count_files(EXPORT_DIR, (".csv",))
 
-    topics = []
     sr = get_sheet()
-    if sr:
-        try: topics = sr.get_all_topics()
-        except Exception: pass
+    topics = _stats_topics(sr) if sr else []
 
     return jsonify({
         "topics":    len(topics),
@@ -220,124 +395,235 @@ def api_stats():
 #  STAGE 1 — SCRAPER
 # ══════════════════════════════════════════════════════════════════════════════
 
+SCRAPE_UA = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0"
+# Categories scraped at once. Each one still sleeps 1.2–2.6 s between its own
+# pages, so this multiplies the request rate — keep it small for Goodreads.
+SCRAPE_WORKERS = max(1, int(os.environ.get("SCRAPE_WORKERS", "4") or 4))
+
+
+_SCRAPE_SESSION = None
+_scrape_session_lock = threading.Lock()
+
+def _scrape_session():
+    """Keep-alive session shared by the category workers, with backoff on
+    Goodreads throttling (429) and transient 5xx"""
+    global _SCRAPE_SESSION
+    if _SCRAPE_SESSION is not None:
+        return _SCRAPE_SESSION
+    # Workers ask for it all at once on the first scrape; build exactly one
+    with _scrape_session_lock:
+        if _SCRAPE_SESSION is not None:
+            return _SCRAPE_SESSION
+        import requests as req_lib
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        session = req_lib.Session()
+        adapter = HTTPAdapter(
+            pool_connections=2, pool_maxsize=SCRAPE_WORKERS,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers["User-Agent"] = SCRAPE_UA
+        _SCRAPE_SESSION = session
+        return session
+
+
+def _clean(t):
+    if not t: return ""
+    t = _DASH_SPLIT_RE.split(t, 1)[0]
+    for a, b in [
+        ("\u201c", '"'),
+        ("\u201d", '"'),
+        ("\u2018", "'"),
+        ("\u2019", "'"),
+    ]:
+        t = t.replace(a, b)
+    t = t.encode('ascii','ignore').decode().strip().strip('"\'')
+    return ' '.join(t.split())
+
+
+def _auth(t):
+    if not t: return "Unknown"
+    t = _AUTH_CLEAN_RE.sub(' ', t.strip())
+    return ' '.join(t.split()) or "Unknown"
+
+
+def _dedup_key(text: str) -> int:
+    """64-bit digest of a quote's lower-cased text for the scrape dedup sets:
+    an int per quote instead of a second copy of every string, and the
+    collision odds at 10^5 quotes are ~10^-10."""
+    return int.from_bytes(hashlib.blake2b(text.lower().encode(), digest_size=8).digest(), "little")
+
+
+# (tag, class) -> field for _quote_parts; img matches on tag alone
+_QUOTE_PARTS = {
+    ("div", "quoteText"): "text", ("span", "authorOrTitle"): "author",
+    ("div", "greyText"): "tags",  ("div", "right"): "likes",
+}
+
+def _quote_parts(div) -> dict:
+    """First quoteText/authorOrTitle/greyText/right/img under one div.quote,
+    collected in a single walk instead of one find() per field."""
+    parts = {}
+    for el in div.descendants:
+        name = getattr(el, "name", None)
+        if name is None:
+            continue  # text node
+        if name == "img":
+            parts.setdefault("img", el)
+            continue
+        for cls in el.get("class") or ():
+            field = _QUOTE_PARTS.get((name, cls))
+            if field:
+                parts.setdefault(field, el)
+    return parts
+
+
+def _scrape_category(name: str, url: str, page_limit: int,
+                     seen: set, seen_lock: threading.Lock) -> int:
+    """Scrape one Goodreads tag into Export/<name>.csv; returns quotes added.
+
+    seen is shared by all categories running at once (guarded by seen_lock)
+    so a quote tagged under two categories is only saved the first time.
+    """
+    import random as rlib, time as tlib
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    # Only the quote blocks and the pager are read — don't build the rest of
+    # the page (nav, ads, sidebars) into the tree
+    only = SoupStrainer(["div", "a"], class_=_SCRAPE_KEEP_RE)
+
+    cat_added = 0
+    csv_path  = EXPORT_DIR / f"{name}.csv"
+
+    existing: set[int] = set()
+    last_sno = 0
+    if csv_path.exists():
+        # Plain csv.reader + column index: no per-row dict for a file that
+        # can run to tens of thousands of rows
+        with open(csv_path, newline='', encoding='utf-8') as f:
+            rd = csv.reader(f)
+            header = next(rd, [])
+            qi = header.index("QUOTE") if "QUOTE" in header else -1
+            si = header.index("SNO") if "SNO" in header else -1
+            for row in rd:
+                if qi >= 0 and qi < len(row):
+                    q = row[qi].strip()
+                    if q: existing.add(_dedup_key(q))
+                if si >= 0 and si < len(row):
+                    try: last_sno = max(last_sno, int(row[si] or 0))
+                    except Exception: pass
+
+    session = _scrape_session()
+    with open(csv_path, 'a', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        if f.tell() == 0:
+            writer.writerow(CSV_HEADER)
+
+        cur, pages = url, 0
+        while cur and (page_limit == 0 or pages < page_limit):
+            tlib.sleep(rlib.uniform(1.2, 2.6))
+            try:
+                r = session.get(cur, timeout=30)
+                r.raise_for_status()
+            except Exception as e:
+                SCRAPE_LOG.append({"type":"warn","msg":f"{name} pg{pages+1}: {e}"})
+                break
+
+            soup = BeautifulSoup(r.text, "lxml", parse_only=only)
+            new_rows = []
+            for div in soup.find_all("div", class_="quote"):
+                try:
+                    parts = _quote_parts(div)
+                    qt = parts.get("text")
+                    if not qt: continue
+                    q = _clean(qt.get_text(strip=True))
+                    if not q or len(q) < 50: continue
+                    key = _dedup_key(q)
+                    if key in existing: continue
+                    a_sp  = parts.get("author")
+                    auth  = _auth(a_sp.get_text(strip=True) if a_sp else "")
+                    td    = parts.get("tags")
+                    tags  = (td.get_text(strip=True) if td else "").replace("tags:","").strip()
+                    ii    = parts.get("img")
+                    img   = ii.get("src","") if ii else ""
+                    ld    = parts.get("likes")
+                    m     = _LIKES_RE.match(ld.get_text(strip=True)) if ld else None
+                    likes = int(m.group(1).replace(",", "") or 0) if m else 0
+                    # Claim the quote only once its row parsed: a row that
+                    # fails above must not hide it from other categories
+                    with seen_lock:
+                        if key in seen: continue
+                        seen.add(key)
+                    existing.add(key)
+                    last_sno += 1; cat_added += 1
+                    new_rows.append([last_sno,"",name,auth,q,"",tags,likes,img,len(q)])
+                except Exception: continue
+            writer.writerows(new_rows)
+
+            pages += 1
+            nxt = soup.find("a", class_="next_page")
+            cur = f"https://www.goodreads.com{nxt['href']}" if nxt else None
+
+    SCRAPE_LOG.append({"type":"ok","msg":f"✅ {name}: {cat_added} new quotes"})
+    return cat_added
+
+
 @app.route("/api/scrape/start", methods=["POST"])
 def api_scrape_start():
-    if SCRAPE_ACTIVE.is_set():
-        return jsonify({"ok": False, "error": "Scrape already running"}), 409
-
     data       = request.get_json() or {}
     cat_ids    = [int(x) for x in (data.get("categories") or [])]
     page_limit = int(data.get("page_limit") or 1)
     selected   = [c for c in CATEGORIES if c[0] in cat_ids] if cat_ids else CATEGORIES
 
-    job_id = uuid.uuid4().hex
-    JOBS[job_id] = {"status":"running","progress":0.0,"message":"Starting…","result":None}
-
     def _run():
-        SCRAPE_ACTIVE.set()
         SCRAPE_LOG.clear()
         grand_total = 0
         total = len(selected)
 
         try:
-            import requests as req_lib, random as rlib, time as tlib
-            from bs4 import BeautifulSoup
-
-            UA = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0"
-            seen: set[str] = set()
-            session = req_lib.Session()
-
-            def _clean(t):
-                if not t: return ""
-                t = re.split(r'\s*[-—]+\s*', t, 1)[0]
-                for a, b in [
-                    ("\u201c", '"'),
-                    ("\u201d", '"'),
-                    ("\u2018", "'"),
-                    ("\u2019", "'"),
-                ]:
-                    t = t.replace(a, b)
-                t = t.encode('ascii','ignore').decode().strip().strip('"\'')
-                return ' '.join(t.split())
-
-            def _auth(t):
-                if not t: return "Unknown"
-                t = re.sub(r'[=,\.\-]+',' ', t.strip())
-                return ' '.join(t.split()) or "Unknown"
-
-            for i, (num, name, url) in enumerate(selected):
-                JOBS[job_id]["message"]  = f"Scraping: {name} ({i+1}/{total})"
-                JOBS[job_id]["progress"] = i / total
-                cat_added = 0
-                csv_path  = EXPORT_DIR / f"{name}.csv"
-
-                existing: set[str] = set()
-                last_sno = 0
-                if csv_path.exists():
-                    with open(csv_path, newline='', encoding='utf-8') as f:
-                        for row in csv.DictReader(f):
-                            q = (row.get("QUOTE") or "").strip().lower()
-                            if q: existing.add(q)
-                            try: last_sno = max(last_sno, int(row.get("SNO") or 0))
-                            except Exception: pass
-
-                with open(csv_path, 'a', newline='', encoding='utf-8') as f:
-                    writer = csv.writer(f)
-                    if f.tell() == 0:
-                        writer.writerow(CSV_HEADER)
-
-                    cur, pages = url, 0
-                    while cur and (page_limit == 0 or pages < page_limit):
-                        tlib.sleep(rlib.uniform(1.2, 2.6))
-                        try:
-                            r = session.get(cur, headers={"User-Agent": UA}, timeout=30)
-                            r.raise_for_status()
-                        except Exception as e:
-                            SCRAPE_LOG.append({"type":"warn","msg":f"{name} pg{pages+1}: {e}"})
-                            break
-
-                        soup = BeautifulSoup(r.text, "lxml")
-                        for div in soup.find_all("div", class_="quote"):
-                            try:
-                                qt = div.find("div", class_="quoteText")
-                                if not qt: continue
-                                q = _clean(qt.get_text(strip=True))
-                                if not q or len(q) < 50: continue
-                                key = q.lower()
-                                if key in existing or key in seen: continue
-                                a_sp  = div.find("span", class_="authorOrTitle")
-                                auth  = _auth(a_sp.get_text(strip=True) if a_sp else "")
-                                td    = div.find("div", class_="greyText")
-                                tags  = (td.get_text(strip=True) if td else "").replace("tags:","").strip()
-                                ii    = div.find("img")
-                                img   = ii.get("src","") if ii else ""
-                                ld    = div.find("div", class_="right")
-                                likes = 0
-                                if ld:
-                                    lt = ld.get_text(strip=True)
-                                    if "likes" in lt:
-                                        ln = lt.split("likes")[0].strip().replace(",","")
-                                        likes = int(ln) if ln.isdigit() else 0
-                                existing.add(key); seen.add(key)
-                                last_sno += 1; cat_added += 1; grand_total += 1
-                                writer.writerow([last_sno,"",name,auth,q,"",tags,likes,img,len(q)])
-                            except Exception: continue
-
-                        pages += 1
-                        nxt = soup.find("a", class_="next_page")
-                        cur = f"https://www.goodreads.com{nxt['href']}" if nxt else None
-
-                SCRAPE_LOG.append({"type":"ok","msg":f"✅ {name}: {cat_added} new quotes"})
-
-            JOBS[job_id].update({"status":"done","progress":1.0,
-                "message":f"Done — {grand_total} quotes saved",
-                "result":{"total": grand_total}})
+            import requests, bs4  # fail the job up front, not once per category
+            seen: set[int] = set()
+            seen_lock = threading.Lock()
+            # Scraping is network-bound: overlap categories, each writing its
+            # own CSV, and report progress as they finish
+            with ThreadPoolExecutor(max_workers=min(SCRAPE_WORKERS, max(1, total)),
+                                    thread_name_prefix="scrape") as pool:
+                futures = {pool.submit(_scrape_category, name, url, page_limit, seen, seen_lock): name
+                           for _num, name, url in selected}
+                JOBS.update(job_id, message=f"Scraping {total} categories…")
+                for i, fut in enumerate(as_completed(futures), 1):
+                    name = futures[fut]
+                    try:
+                        grand_total += fut.result()
+                    except Exception as e:
+                        SCRAPE_LOG.append({"type":"warn","msg":f"{name}: {e}"})
+                    JOBS.update(job_id, message=f"Scraped: {name} ({i}/{total})", progress=i / total)
+
+            JOBS.update(job_id, status="done", progress=1.0,
+                message=f"Done — {grand_total} quotes saved",
+                result={"total": grand_total})
         except Exception as e:
-            JOBS[job_id].update({"status":"error","message":str(e),"result":None})
+            JOBS.update(job_id, status="error", message=str(e), result=None)
         finally:
             SCRAPE_ACTIVE.clear()
+            _scrape_claim.release()
 
-    threading.Thread(target=_run, daemon=True).start()
+    if not _scrape_claim.acquire(blocking=False):
+        return jsonify({"ok": False, "error": "Scrape already running"}), 409
+    SCRAPE_ACTIVE.set()
+
+    job_id = _new_job_id()
+    try:
+        JOBS.start(job_id, {"status":"running","progress":0.0,"message":"Starting…","result":None})
+        threading.Thread(target=_run, daemon=True).start()
+    except BaseException as e:
+        # _run never started, so its finally won't hand the claim back
+        JOBS.update(job_id, status="error", message=str(e), result=None)
+        SCRAPE_ACTIVE.clear()
+        _scrape_claim.release()
+        raise
     return jsonify({"ok": True, "job_id": job_id})
 
 
@@ -349,6 +635,46 @@ def api_scrape_log():
 #  STAGE 2 — REVIEW  (local CSV files)
 # ══════════════════════════════════════════════════════════════════════════════
 
+def _stat_cached(fn):
+    """Memoise fn(path) until the file's mtime or size changes.
+
+    The review UI re-reads the same CSVs on every page and category refresh;
+    only a file the scraper has since appended to needs counting again.
+    """
+    cache: dict[Path, tuple[tuple[int, int], object]] = {}
+
+    def wrapper(path: Path):
+        st  = path.stat()
+        key = (st.st_mtime_ns, st.st_size)
+        hit = cache.get(path)
+        if hit and hit[0] == key:
+            return hit[1]
+        val = fn(path)
+        cache[path] = (key, val)
+        return val
+    return wrapper
+
+
+@_stat_cached
+def _csv_row_count(path: Path) -> int:
+    """Data rows (CSV records, so quoted newlines don't count twice)"""
+    with open(path, newline='', encoding='utf-8') as fh:
+        return max(0, sum(1 for row in csv.reader(fh) if row) - 1)
+
+
+@_stat_cached
+def _csv_line_count(path: Path) -> int:
+    """Lines after the header, counted on raw bytes — no decoding or splitting"""
+    n, last = 0, b"\n"
+    with open(path, 'rb') as fh:
+        while chunk := fh.read(1 << 20):
+            n += chunk.count(b"\n")
+            last = chunk[-1:]
+    if last != b"\n":
+        n += 1  # final line without a terminator
+    return max(0, n - 1)
+
+
 @app.route("/api/review/categories")
 def api_review_cats():
     cats = []
@@ -356,8 +682,7 @@ def api_review_cats():
         for f in sorted(EXPORT_DIR.glob("*.csv")):
             count = 0
             try:
-                with open(f, newline='', encoding='utf-8') as fh:
-                    count = max(0, sum(1 for _ in fh) - 1)
+                count = _csv_line_count(f)
             except Exception:
                 pass
             cats.append({"name": f.stem, "count": count})
@@ -374,19 +699,61 @@ def api_review_quotes():
     if not f.exists():
         return jsonify({"quotes":[], "total":0})
 
-    rows = []
+    page, total = [], 0
     try:
         with open(f, newline='', encoding='utf-8') as fh:
-            rows = list(csv.DictReader(fh))
+            page = list(itertools.islice(csv.DictReader(fh), offset, offset + limit))
+        total = _csv_row_count(f)
     except Exception:
         pass
 
-    page   = rows[offset: offset + limit]
     quotes = [{"quote":r.get("QUOTE",""), "translate":r.get("TRANSLATE",""), "author":r.get("AUTHOR",""),
                "category":r.get("CATEGORY",""), "tags":r.get("TAGS",""),
                "image":r.get("IMAGE",""), "length":r.get("TOTAL",""),
                "likes":r.get("LIKES","")} for r in page]
-    return jsonify({"quotes": quotes, "total": len(rows)})
+    return jsonify({"quotes": quotes, "total": total})
+
+
+# Lower-cased QUOTE column of the Database tab, reused across pushes for
+# PUSH_DEDUP_TTL seconds and extended with each successful append
+PUSH_DEDUP_TTL = 60.0
+_push_dedup = {"t": 0.0, "ws": None, "keys": set()}
+_push_lock  = threading.Lock()
+
+def _push_existing_keys(ws) -> set:
+    c, now = _push_dedup, time.monotonic()
+    if c["ws"] == ws.id and now - c["t"] < PUSH_DEDUP_TTL:
+        return c["keys"]
+    header = ws.row_values(1)
+    col = header.index("QUOTE") + 1 if "QUOTE" in header else 5
+    keys = {str(v).strip().lower() for v in ws.col_values(col)[1:]}
+    c.update(t=now, ws=ws.id, keys=keys)
+    return keys
+
+
+def _push_quotes(ws, quotes):
+    existing_keys = set(_push_existing_keys(ws))
+
+    to_add, skipped = [], 0
+    for q in quotes:
+        key = str(q.get("quote","")).strip().lower()
+        if not key or key in existing_keys:
+            skipped += 1
+            continue
+        existing_keys.add(key)
+        to_add.append([
+            "", len(q.get("quote","")),
+            q.get("category",""), q.get("author",""),
+            q.get("quote",""),    q.get("translate",""),
+            q.get("tags",""),     q.get("image",""),
+            "", "", "", "", "Pending", "", ""
+        ])
+
+    if to_add:
+        ws.append_rows(to_add, value_input_option="USER_ENTERED")
+        _push_dedup["keys"] = existing_keys  # now includes what was appended
+
+    return jsonify({"ok": True, "pushed": len(to_add), "skipped": skipped})
 
 
 @app.route("/api/review/push", methods=["POST"])
@@ -403,30 +770,8 @@ def api_review_push():
 
     try:
         ws = sr.spreadsheet.worksheet("Database")
-        existing_keys = set(
-            str(r.get("QUOTE","")).strip().lower()
-            for r in ws.get_all_records()
-        )
-
-        to_add, skipped = [], 0
-        for q in quotes:
-            key = str(q.get("quote","")).strip().lower()
-            if not key or key in existing_keys:
-                skipped += 1
-                continue
-            existing_keys.add(key)
-            to_add.append([
-                "", len(q.get("quote","")),
-                q.get("category",""), q.get("author",""),
-                q.get("quote",""),    q.get("translate",""),
-                q.get("tags",""),     q.get("image",""),
-                "", "", "", "", "Pending", "", ""
-            ])
-
-        if to_add:
-            ws.append_rows(to_add, value_input_option="USER_ENTERED")
-
-        return jsonify({"ok": True, "pushed": len(to_add), "skipped": skipped})
+        with _push_lock:
+            return _push_quotes(ws, quotes)
     except Exception as e:
         return jsonify({"ok": False, "error": str(e)})
 
@@ -452,6 +797,37 @@ def api_quotes(topic):
     return jsonify({"quotes": quotes})
 
 
+# One Translator for the process (constructing one sets up an HTTP client and
+# fetches a token); googletrans' client isn't documented as thread-safe, so
+# calls are serialised. Non-empty results are memoised — the same quote is
+# often re-translated while trying fonts and layouts.
+_translator = None
+_translator_lock = threading.Lock()
+_TRANSLATE_CACHE: dict[tuple[str, str, str], str] = {}
+_TRANSLATE_CACHE_MAX = 4096
+
+def _get_translator():
+    global _translator
+    if _translator is None:
+        _translator = Translator()
+    return _translator
+
+
+def _translate(text: str, src: str, dest: str) -> str:
+    key = (text, src, dest)
+    hit = _TRANSLATE_CACHE.get(key)
+    if hit is not None:
+        return hit
+    with _translator_lock:
+        res = _get_translator().translate(text, src=src, dest=dest)
+        translated = str(getattr(res, 'text', '') or '')
+        if translated:
+            if len(_TRANSLATE_CACHE) >= _TRANSLATE_CACHE_MAX:
+                del _TRANSLATE_CACHE[next(iter(_TRANSLATE_CACHE))]
+            _TRANSLATE_CACHE[key] = translated
+    return translated
+
+
 @app.route("/api/translate", methods=["POST"])
 def api_translate():
     data = request.get_json() or {}
@@ -466,9 +842,7 @@ def api_translate():
         return jsonify({"ok": False, "error": "Translation not available. Install requirements."}), 503
 
     try:
-        t = Translator()
-        res = t.translate(text, src=src, dest=dest)
-        translated = str(getattr(res, 'text', '') or '')
+        translated = _translate(text, src, dest)
 
         saved = False
         save_error = None
@@ -509,46 +883,121 @@ def api_fonts():
     return jsonify({"fonts": fonts})
 
 
+# JSON types accepted per job payload field; None/missing always means "use the
+# default". Normalised once at import, checked before a job is queued —
+# the workers still coerce values (int(), float(), …) as before.
+_NUM = (int, float, str)
+_PAYLOAD_SCHEMA = {
+    "quote": str, "translate": str, "author": str, "author_image": str,
+    "category": str, "topic": str, "style": str, "language": str,
+    "font_name": str, "font_name_en": str, "font_name_ur": str,
+    "avatar_position": str, "background_mode": str, "ai_model": str,
+    "hf_api_key": str, "watermark_blend": str,
+    "row": (int, str), "count": (int, str),
+    "quote_font_size": _NUM, "author_font_size": _NUM,
+    "watermark_opacity": _NUM, "watermark_size_percent": _NUM,
+    "upload_to_drive": bool,
+}
+_PAYLOAD_CHECKS = tuple((k, t if isinstance(t, tuple) else (t,)) for k, t in _PAYLOAD_SCHEMA.items())
+
+
+def _payload_error(payload: Mapping) -> str | None:
+    for key, types in _PAYLOAD_CHECKS:
+        v = payload.get(key)
+        if v is not None and not isinstance(v, types):
+            return f"payload.{key} must be {' or '.join(t.__name__ for t in types)}"
+    return None
+
+
 @app.route("/api/job/start", methods=["POST"])
 def api_job_start():
     data    = request.get_json() or {}
     kind    = str(data.get("kind","")).strip().lower()
+    if kind not in _JOB_KINDS:
+        return jsonify({"status":"error","error":f"Unknown job kind: {kind}"}), 400
     payload = data.get("payload") or {}
-    job_id  = uuid.uuid4().hex
-    JOBS[job_id] = {"status":"running","progress":0.0,"message":"Queued","result":None}
+    # Parsed once here; the worker gets a read-only view so nothing downstream
+    # can mutate (or need to copy) the request body
+    payload = dict(payload) if isinstance(payload, dict) else {}
+    err = _payload_error(payload)
+    if err:
+        return jsonify({"status":"error","error":err}), 400
+    # The HF key travels beside the payload, never inside it, so it can't end
+    # up in a job record, a result or a log line built from the payload
+    hf_api_key = payload.pop("hf_api_key", None) or None
+    payload = MappingProxyType(payload)
+    if not _job_slots.acquire(blocking=False):
+        return jsonify({"status":"error","error":"Server busy — too many queued jobs, try again shortly"}), 429
+    job_id  = _new_job_id()
+    try:
+        JOBS.start(job_id, {"status":"running","progress":0.0,"message":"Queued","result":None})
+        JOB_EXECUTOR.submit(_run_job, job_id, kind, payload, hf_api_key=hf_api_key)
+    except BaseException as e:
+        # _run_job never got the job, so its finally won't return the slot
+        JOBS.update(job_id, status="error", message=str(e), result=None)
+        _job_slots.release()
+        raise
+    return jsonify({"job_id": job_id})
+
 
+def _run_job(job_id: str, kind: str, payload: Mapping, *, hf_api_key: str | None = None):
     try:
-        if kind == "single":
-            JOBS[job_id]["message"]  = "Rendering image…"
-            JOBS[job_id]["progress"] = 0.10
-            result = _single(payload, job_id)
-        elif kind == "bulk":
-            JOBS[job_id]["message"]  = "Preparing bulk…"
-            JOBS[job_id]["progress"] = 0.05
-            result = _bulk(payload, job_id)
-        else:
-            raise ValueError(f"Unknown job kind: {kind}")
-        JOBS[job_id].update({"status":"done","progress":1.0,"message":"Done","result":result})
+        message, progress, handler = _JOB_KINDS[kind]
+        JOBS.update(job_id, message=message, progress=progress)
+        result = handler(payload, job_id, hf_api_key=hf_api_key)
+        JOBS.update(job_id, status="done", progress=1.0, message="Done", result=result)
     except Exception as e:
-        JOBS[job_id].update({"status":"error","message":str(e),"result":None})
-
-    return jsonify({"job_id": job_id})
+        JOBS.update(job_id, status="error", message=str(e), result=None)
+    finally:
+        _job_slots.release()
 
 
 @app.route("/api/job/status/<job_id>")
 def api_job_status(job_id):
-    s = JOBS.get(job_id)
+    rev, s = JOBS.get_versioned(job_id)
     if not s:
         return jsonify({"status":"error","error":"Unknown job"}), 404
-    return jsonify(s)
+    # The revision changes on every update, so it is an exact validator:
+    # polls between progress ticks get a bodiless 304
+    etag = f"{job_id}-{rev}"
+    if request.if_none_match.contains_weak(etag):
+        resp = Response(status=304)
+    else:
+        resp = jsonify(s)
+    resp.set_etag(etag, weak=True)
+    resp.headers["Cache-Control"] = "no-cache"
+    return resp
+
+
+@app.route("/api/job/stream/<job_id>")
+def api_job_stream(job_id):
+    """Server-sent events: one message per job update, until it finishes"""
+    if JOBS.get(job_id) is None:
+        return jsonify({"status":"error","error":"Unknown job"}), 404
+
+    def events():
+        rev = -1
+        while True:
+            new_rev, s = JOBS.watch(job_id, rev)
+            if s is None:
+                return
+            if new_rev == rev:
+                yield ": keep-alive\n\n"
+                continue
+            rev = new_rev
+            yield f"data: {app.json.dumps(s)}\n\n"
+            if s.get("status") != "running":
+                return
+
+    return Response(events(), mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
 
 
-def _single(data: dict, job_id: str) -> dict:
+def _single(data: Mapping, job_id: str, *, hf_api_key: str | None = None) -> dict:
     g = get_gen()
     if not g: raise RuntimeError("Image generator not available — check Pillow install")
 
-    JOBS[job_id]["progress"] = 0.25
-    JOBS[job_id]["message"]  = "Rendering…"
+    JOBS.update(job_id, progress=0.25, message="Rendering…")
 
     language = str(data.get("language") or "en").strip().lower()
     font_en = data.get("font_name_en") or data.get("font_name") or None
@@ -578,12 +1027,11 @@ def _single(data: dict, job_id: str) -> dict:
         watermark_position= "bottom-right",
         background_mode   = str(data.get("background_mode") or "none"),
         ai_model          = data.get("ai_model") or None,
-        hf_api_key        = data.get("hf_api_key") or None,
+        hf_api_key        = hf_api_key,
         language          = language,
     )
 
-    JOBS[job_id]["progress"] = 0.65
-    JOBS[job_id]["message"]  = "Writing to Sheet…"
+    JOBS.update(job_id, progress=0.65, message="Writing to Sheet…")
 
     sr = get_sheet()
     upload_result = "Saved locally"
@@ -591,11 +1039,7 @@ def _single(data: dict, job_id: str) -> dict:
     topic = data.get("topic","")
     if sr and row and topic:
         try:
-            abs_url = f"http://localhost:8000/generated/{Path(path).name}"
-            ok = sr.write_back(str(topic), int(row), abs_url)
-            with __import__("PIL").Image.open(path) as im:
-                dims = f"{im.width}x{im.height}"
-            sr.write_generation_meta(int(row), dims, datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            ok = _write_back_row(sr, str(topic), int(row), path)
             upload_result = "✅ Written to Sheet" if ok else "⚠️ Sheet write failed"
         except Exception as e:
             upload_result = f"Sheet error: {e}"
@@ -603,8 +1047,7 @@ def _single(data: dict, job_id: str) -> dict:
     drive_link = None
     drive_error = None
     if bool(data.get("upload_to_drive")):
-        JOBS[job_id]["progress"] = 0.82
-        JOBS[job_id]["message"]  = "Uploading to Google Drive…"
+        JOBS.update(job_id, progress=0.82, message="Uploading to Google Drive…")
         du = get_drive()
         if not du:
             drive_error = "Drive uploader not available"
@@ -616,18 +1059,106 @@ def _single(data: dict, job_id: str) -> dict:
             except Exception as e:
                 drive_error = str(e)
 
-    JOBS[job_id]["progress"] = 0.90
+    JOBS.update(job_id, progress=0.90)
     return {
         "success":       True,
         "image_path":    path,
-        "public_url":    f"/generated/{Path(path).name}",
+        "public_url":    _generated_url(Path(path).name, os.stat(path)),
         "upload_result": upload_result,
         "drive_link":    drive_link,
         "drive_error":   drive_error,
     }
 
 
-def _bulk(data: dict, job_id: str) -> dict:
+_JPEG_SOF = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}  # not DHT/JPG/DAC
+
+def _img_dims(path: str) -> tuple[int, int]:
+    """(width, height) from the file header — PNG IHDR or JPEG SOFn — without
+    decoding; anything else goes through Pillow."""
+    with open(path, "rb") as f:
+        head = f.read(24)
+        if head[:8] == b"\x89PNG\r\n\x1a\n" and head[12:16] == b"IHDR":
+            return struct.unpack(">II", head[16:24])
+        if head[:2] == b"\xff\xd8":
+            f.seek(2)
+            while True:
+                marker = f.read(2)
+                if len(marker) < 2 or marker[0] != 0xFF:
+                    break
+                if marker[1] in (0xD8, 0x01) or 0xD0 <= marker[1] <= 0xD7:
+                    continue  # standalone markers carry no length
+                seg = f.read(2)
+                if len(seg) < 2:
+                    break
+                (seg_len,) = struct.unpack(">H", seg)
+                if marker[1] in _JPEG_SOF:
+                    sof = f.read(5)
+                    if len(sof) == 5:
+                        h, w = struct.unpack(">xHH", sof)
+                        return w, h
+                    break
+                f.seek(seg_len - 2, os.SEEK_CUR)
+    with __import__("PIL").Image.open(path) as im:
+        return im.width, im.height
+
+
+def _generated_url(name: str, st: os.stat_result) -> str:
+    """URL for a Generated_Images file, versioned by mtime: names repeat
+    within a minute, so a re-render must not hit the browser's cached copy"""
+    return f"/generated/{url_quote(name)}?v={st.st_mtime_ns}"
+
+
+def _write_back_row(sr, topic: str, row: int, path: str) -> bool:
+    """Write preview link, status and generation meta for one Sheet row."""
+    abs_url = "http://localhost:8000" + _generated_url(Path(path).name, os.stat(path))
+    w, h = _img_dims(path)
+    dims = f"{w}x{h}"
+    return sr.write_back(topic, row, abs_url, dimensions=dims,
+                         timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+
+
+def _bulk_write_back(sr, topic: str, row: int, path: str):
+    try:
+        _write_back_row(sr, topic, row, path)
+    except Exception as e:
+        print(f"[WARN] bulk sheet write: {e}")
+
+
+# Bulk renders are CPU-bound (layout, compositing, PNG encode) and each image
+# is independent, so they fan out to worker processes, each holding its own
+# QuoteImageGenerator (fonts loaded once per process). Opt-in: the default
+# BULK_WORKERS=1 keeps rendering in-process on the shared generator.
+BULK_WORKERS = max(1, int(os.environ.get("BULK_WORKERS", "1") or 1))
+_bulk_pool: ProcessPoolExecutor | None = None
+_worker_gen = None
+
+
+def _bulk_worker_init(output_dir: str, watermark_dir: str):
+    global _worker_gen
+    import random
+    random.seed()  # fresh OS entropy per worker for the styles' random picks
+    _worker_gen = QuoteImageGenerator(output_dir=output_dir, watermark_dir=watermark_dir)
+
+
+def _render_one(kwargs: dict) -> str:
+    return _worker_gen.generate(**kwargs)
+
+
+def _get_bulk_pool() -> ProcessPoolExecutor | None:
+    global _bulk_pool
+    if _bulk_pool is None and BULK_WORKERS > 1:
+        # spawn, not fork: the server has live threads (request, job, scrape)
+        # whose locks a forked child could inherit mid-acquire
+        _bulk_pool = ProcessPoolExecutor(
+            max_workers=BULK_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_bulk_worker_init,
+            initargs=(str(BASE_DIR / "Generated_Images"), str(BASE_DIR / "Watermarks")),
+        )
+    return _bulk_pool
+
+
+def _bulk(data: Mapping, job_id: str, *, hf_api_key: str | None = None) -> dict:
     g  = get_gen()
     sr = get_sheet()
     if not g: raise RuntimeError("Image generator not available")
@@ -646,48 +1177,84 @@ def _bulk(data: dict, job_id: str) -> dict:
     font_ur = data.get("font_name_ur") or data.get("font_name") or None
     font_name = font_ur if language in ("ur", "urdu") else font_en
 
-    for q in selected:
-        JOBS[job_id]["message"]  = f"Generating {done+1}/{total}…"
-        JOBS[job_id]["progress"] = 0.10 + 0.80 * (done / total)
-        try:
-            quote_src = q.get("quote", "")
-            if language in ("ur", "urdu"):
-                quote_src = q.get("translate") or q.get("quote", "")
-            quote_src = _sanitize_quote_author(quote_src, str(q.get("author", "")))
-
-            path = g.generate(
-                quote             = quote_src,
-                author            = q.get("author",""),
-                style             = data.get("style","elegant"),
-                category          = q.get("category",""),
-                author_image      = str(q.get("author_image") or q.get("image") or ""),
-                watermark_mode    = "corner",
-                watermark_opacity = float(data.get("watermark_opacity") or 0.7),
-                watermark_blend   = str(data.get("watermark_blend") or "normal"),
-                avatar_position   = str(data.get("avatar_position") or "top-left"),
-                font_name         = font_name,
-                quote_font_size   = int(data.get("quote_font_size") or 52),
-                author_font_size  = int(data.get("author_font_size") or 30),
-                watermark_size_percent = float(data.get("watermark_size_percent") or 0.15),
-                watermark_position= "bottom-right",
-                background_mode   = str(data.get("background_mode") or "none"),
-                ai_model          = data.get("ai_model") or None,
-                hf_api_key        = data.get("hf_api_key") or None,
-                language          = language,
-            )
-            if sr and q.get("_row") and topic:
-                abs_url = f"http://localhost:8000/generated/{Path(path).name}"
-                sr.write_back(topic, int(q["_row"]), abs_url)
-                with __import__("PIL").Image.open(path) as im:
-                    dims = f"{im.width}x{im.height}"
-                sr.write_generation_meta(int(q["_row"]), dims, datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-        except Exception as e:
-            print(f"[WARN] bulk gen: {e}")
-        done += 1
+    # Payload-level options are the same for every quote: convert them once
+    # (a bad value now fails the job up front instead of every image)
+    base_kwargs = dict(
+        style             = data.get("style","elegant"),
+        watermark_mode    = "corner",
+        watermark_opacity = float(data.get("watermark_opacity") or 0.7),
+        watermark_blend   = str(data.get("watermark_blend") or "normal"),
+        avatar_position   = str(data.get("avatar_position") or "top-left"),
+        font_name         = font_name,
+        quote_font_size   = int(data.get("quote_font_size") or 52),
+        author_font_size  = int(data.get("author_font_size") or 30),
+        watermark_size_percent = float(data.get("watermark_size_percent") or 0.15),
+        watermark_position= "bottom-right",
+        background_mode   = str(data.get("background_mode") or "none"),
+        ai_model          = data.get("ai_model") or None,
+        hf_api_key        = hf_api_key,
+        language          = language,
+    )
+
+    global _bulk_pool
+    # AI backgrounds are Hugging Face calls, not CPU work: keep them on the
+    # shared in-process client so its pacing and rate limits apply to the
+    # whole job instead of one client per worker process
+    ai_bg = base_kwargs["background_mode"].strip().lower() == "ai"
+    pool = None if ai_bg else _get_bulk_pool()
+    # Sheet write-back is network-bound: hand it to a single writer thread so
+    # it overlaps with rendering while each finished image is written back.
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="sheet-write") as writer, \
+         ThreadPoolExecutor(max_workers=1, thread_name_prefix="render") as local:
+        futures = {}
+        JOBS.update(job_id, message=f"Generating 0/{total}…", progress=0.10)
+        for q in selected:
+            try:
+                quote_src = q.get("quote", "")
+                if language in ("ur", "urdu"):
+                    quote_src = q.get("translate") or q.get("quote", "")
+                quote_src = _sanitize_quote_author(quote_src, str(q.get("author", "")))
+
+                kwargs = dict(
+                    base_kwargs,
+                    quote             = quote_src,
+                    author            = q.get("author",""),
+                    category          = q.get("category",""),
+                    author_image      = str(q.get("author_image") or q.get("image") or ""),
+                )
+                fut = pool.submit(_render_one, kwargs) if pool else local.submit(g.generate, **kwargs)
+                futures[fut] = q
+            except Exception as e:
+                print(f"[WARN] bulk gen: {e}")
+                done += 1
+
+        for fut in as_completed(futures):
+            q = futures[fut]
+            try:
+                path = fut.result()
+                if sr and q.get("_row") and topic:
+                    writer.submit(_bulk_write_back, sr, topic, int(q["_row"]), path)
+            except BrokenProcessPool as e:
+                print(f"[WARN] bulk gen: {e}")
+                if _bulk_pool is pool:
+                    # tear the dead executor down; a fresh pool starts next time
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    _bulk_pool = None
+            except Exception as e:
+                print(f"[WARN] bulk gen: {e}")
+            done += 1
+            JOBS.update(job_id, message=f"Generating {done}/{total}…", progress=0.10 + 0.80 * (done / total))
 
     return {"success": True, "generated": done}
 
 
+# kind -> (first status message, first progress, handler)
+_JOB_KINDS = {
+    "single": ("Rendering image…", 0.10, _single),
+    "bulk":   ("Preparing bulk…",  0.05, _bulk),
+}
+
+
 @app.route("/api/drive/upload", methods=["POST"])
 def api_drive_upload():
     data = request.get_json() or {}
@@ -744,8 +1311,9 @@ def api_translate_status():
     if not _TRANSLATE_OK:
         return jsonify({"ok": False, "available": False, "error": "googletrans not installed"})
     try:
-        t = Translator()
-        res = t.translate("Hello", src="en", dest="ur")
+        # Live round-trip on purpose (not _translate's cache): this is a health check
+        with _translator_lock:
+            res = _get_translator().translate("Hello", src="en", dest="ur")
         txt = str(getattr(res, 'text', '') or '')
         return jsonify({"ok": True, "available": True, "working": bool(txt), "sample": txt})
     except Exception as e:
@@ -755,38 +1323,122 @@ def api_translate_status():
 #  STAGE 4 — POST  (placeholder)
 # ══════════════════════════════════════════════════════════════════════════════
 
+# Static until posting is implemented — serialised once at import
+_PLATFORMS_BODY = json.dumps({"platforms": [
+    {"id":"instagram","label":"Instagram",  "icon":"📸","connected":False},
+    {"id":"facebook", "label":"Facebook",   "icon":"👥","connected":False},
+    {"id":"twitter",  "label":"X / Twitter","icon":"🐦","connected":False},
+    {"id":"pinterest","label":"Pinterest",  "icon":"📌","connected":False},
+]}).encode()
+
 @app.route("/api/post/platforms")
 def api_post_platforms():
-    return jsonify({"platforms": [
-        {"id":"instagram","label":"Instagram",  "icon":"📸","connected":False},
-        {"id":"facebook", "label":"Facebook",   "icon":"👥","connected":False},
-        {"id":"twitter",  "label":"X / Twitter","icon":"🐦","connected":False},
-        {"id":"pinterest","label":"Pinterest",  "icon":"📌","connected":False},
-    ]})
+    return Response(_PLATFORMS_BODY, mimetype="application/json")
 
 
 @app.route("/api/post/queue")
 def api_post_queue():
     gen_dir = BASE_DIR / "Generated_Images"
     images  = []
-    if gen_dir.exists():
-        files = sorted(
-            list(gen_dir.glob("*.png")) + list(gen_dir.glob("*.jpg")),
-            key=lambda x: x.stat().st_mtime, reverse=True
-        )
-        for f in files[:24]:
-            images.append({"filename": f.name, "url": f"/generated/{f.name}",
-                           "size": f.stat().st_size, "posted": False})
+    try:
+        with os.scandir(gen_dir) as it:
+            # One stat per file, reused for both the sort key and the size
+            entries = [(e.name, e.stat()) for e in it if e.name.endswith((".png", ".jpg"))]
+    except FileNotFoundError:
+        entries = []
+    entries.sort(key=lambda e: e[1].st_mtime, reverse=True)
+    for name, st in entries[:24]:
+        images.append({"filename": name, "url": _generated_url(name, st),
+                       "size": st.st_size, "posted": False})
     return jsonify({"images": images})
 
 
+class _ZipSink(io.RawIOBase):
+    """Write-only, unseekable sink: zipfile writes into it, the response drains it"""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self._chunks.append(bytes(b))
+        return len(b)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _iter_zip(files):
+    """Yield a ZIP of files one entry at a time, never holding the whole archive"""
+    sink = _ZipSink()
+    # PNG/JPEG are already compressed — store them as-is instead of deflating
+    # again. ZIP64 is spelled out: a large batch can pass 4 GiB / 65535 entries.
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_STORED, allowZip64=True) as zf:
+        for f in files:
+            try:
+                src = open(f, "rb")
+            except FileNotFoundError:
+                # Deleted between listing and zipping — skip, don't abort the stream
+                print(f"[WARN] download_all: {f.name} vanished")
+                continue
+            with src:
+                info = zipfile.ZipInfo.from_file(f, arcname=f.name)
+                info.compress_type = zipfile.ZIP_STORED
+                # 1 MiB copies instead of ZipFile.write's 8 KiB reads
+                with zf.open(info, "w", force_zip64=True) as dst:
+                    shutil.copyfileobj(src, dst, 1 << 20)
+            yield sink.drain()
+    yield sink.drain()  # central directory
+
+
+@app.route("/api/post/download_all")
+def api_post_download_all():
+    gen_dir = BASE_DIR / "Generated_Images"
+    try:
+        files = sorted(Path(e.path) for e in os.scandir(gen_dir)
+                       if e.name.endswith((".png", ".jpg")))
+    except FileNotFoundError:
+        files = []
+    if not files:
+        return jsonify({"ok": False, "error": "No generated images"}), 404
+
+    return Response(_iter_zip(files), mimetype="application/zip",
+                    headers={"Content-Disposition": "attachment; filename=generated_images.zip"})
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 #  STATIC
 # ══════════════════════════════════════════════════════════════════════════════
 
+# Behind nginx, set X_ACCEL_REDIRECT_PREFIX to an internal location that
+# aliases Generated_Images, e.g.
+#   location /_generated/ { internal; alias /srv/quotes/Generated_Images/; }
+# Flask then only checks the path and nginx sends the file with sendfile(2).
+X_ACCEL_PREFIX = os.environ.get("X_ACCEL_REDIRECT_PREFIX", "").strip().rstrip("/")
+
+# Generated names are <category> - <quote> - <author> - <minute>, so a re-run
+# within the same minute overwrites the file. Links we hand out carry
+# ?v=<mtime> (_generated_url) so a re-render is a new URL; a bare URL still
+# revalidates (ETag / Last-Modified) after this short max-age.
+GENERATED_MAX_AGE = 300
+
 @app.route("/generated/<filename>")
 def serve_generated(filename):
-    return send_from_directory(BASE_DIR / "Generated_Images", filename)
+    if X_ACCEL_PREFIX:
+        path = safe_join(str(BASE_DIR / "Generated_Images"), filename)
+        if path is None or not os.path.isfile(path):
+            abort(404)
+        resp = Response(mimetype=mimetypes.guess_type(filename)[0] or "application/octet-stream")
+        resp.headers["X-Accel-Redirect"] = f"{X_ACCEL_PREFIX}/{url_quote(filename)}"
+        resp.headers["Cache-Control"] = f"public, max-age={GENERATED_MAX_AGE}"
+        return resp
+    resp = send_from_directory(BASE_DIR / "Generated_Images", filename, max_age=GENERATED_MAX_AGE)
+    resp.cache_control.public = True
+    return resp
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -794,14 +1446,30 @@ def serve_generated(filename):
 # ══════════════════════════════════════════════════════════════════════════════
 
 if __name__ == "__main__":
-    (BASE_DIR / "Generated_Images").mkdir(exist_ok=True)
-    (BASE_DIR / "Export").mkdir(exist_ok=True)
-    (BASE_DIR / "templates").mkdir(exist_ok=True)
-
-    print("\n" + "═"*62)
-    print(f"  🎑  QuoteMaster  v{APP_VERSION_UNIFIED}")
-    print("═"*62)
-    print("  📥  Collect  →  ✅  Review  →  🖼  Generate  →  📤  Post")
-    print(f"\n  🌐  http://localhost:8000\n")
+    # One stat per dir on warm starts; Path.mkdir(exist_ok=True) would do a
+    # failing mkdir plus a stat for each. Export is created at import time.
+    for d in ("Generated_Images", "templates"):
+        p = BASE_DIR / d
+        if not p.is_dir():
+            p.mkdir(parents=True, exist_ok=True)
+
+    pillow_line = f"  🖌  Pillow {PIL_VERSION}\n" if PIL_VERSION else ""
+    sys.stdout.write(
+        f"\n{'═'*62}\n"
+        f"  🎑  QuoteMaster  v{APP_VERSION_UNIFIED}\n"
+        f"{'═'*62}\n"
+        f"  📥  Collect  →  ✅  Review  →  🖼  Generate  →  📤  Post\n"
+        f"{pillow_line}"
+        f"\n  🌐  http://localhost:8000\n\n"
+    )
+    sys.stdout.flush()
     debug = os.getenv("DASHBOARD_DEBUG","").strip().lower() in ("1","true","yes")
-    app.run(host="0.0.0.0", port=8000, debug=debug, use_reloader=False)
+    if waitress_serve is not None and not debug:
+        # Multi-threaded WSGI server: status polls keep answering while a
+        # bulk job is running. Each open /api/job/stream (SSE) holds one of
+        # these threads until its job ends, so size SERVER_THREADS for the
+        # expected open streams plus ordinary requests.
+        threads = max(1, int(os.environ.get("SERVER_THREADS", "16") or 16))
+        waitress_serve(app, host="0.0.0.0", port=8000, threads=threads)
+    else:
+        app.run(host="0.0.0.0", port=8000, debug=debug, threaded=True, use_reloader=False)
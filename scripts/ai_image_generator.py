@@ -6,27 +6,40 @@ Generates background images from text prompts using AI models
 
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 from typing import Optional
 import time
 import io
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from PIL import Image
 
 
+def _sniff_image(data: bytes) -> bool:
+    """True when data starts with a PNG or JPEG signature"""
+    return data[:8] == b'\x89PNG\r\n\x1a\n' or data[:3] == b'\xff\xd8\xff'
+
+
 class AIImageGenerator:
     """Generate images using Hugging Face's free Inference API"""
     
-    def __init__(self, api_key: Optional[str] = None, output_dir: str = "assets/ai_backgrounds"):
+    def __init__(self, api_key: Optional[str] = None, output_dir: str = "assets/ai_backgrounds",
+                 max_retries: int = 3):
         """
         Initialize AI Image Generator
         
         Args:
             api_key: Hugging Face API key (get free at https://huggingface.co/settings/tokens)
             output_dir: Directory to save generated images
+            max_retries: Retries for timeouts, 5xx and "model is loading" (503) replies
         """
         self.api_key = api_key or os.getenv('HUGGINGFACE_API_KEY')
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        if not self.output_dir.is_dir():
+            self.output_dir.mkdir(parents=True, exist_ok=True)
         
         # Free models available on Hugging Face
         # These are completely FREE to use!
@@ -38,6 +51,24 @@ class AIImageGenerator:
         
         self.default_model = self.models['stable_diffusion']
         self.api_url = f"https://api-inference.huggingface.co/models/{self.default_model}"
+
+        # One pooled session for every Inference API call: keep-alive means a
+        # batch pays for a single TLS handshake instead of one per image.
+        # urllib3 retries 5xx/timeouts with backoff (0s, 10s, 20s, ...) and
+        # honours Retry-After; the steps are sized for cold model loads,
+        # which typically take ~20s.
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=5,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=["POST"],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry))
+        if self.api_key:
+            self.session.headers.update({"Authorization": f"Bearer {self.api_key}"})
         
         if not self.api_key:
             print("⚠️  WARNING: No Hugging Face API key found!")
@@ -51,13 +82,17 @@ class AIImageGenerator:
             self.api_url = f"https://api-inference.huggingface.co/models/{self.default_model}"
         else:
             raise ValueError(f"Unknown model: {model_name}. Available: {list(self.models.keys())}")
+
+    def close(self):
+        """Release the pooled HTTP connections"""
+        self.session.close()
     
     def generate_image(
         self, 
         prompt: str, 
         negative_prompt: str = '',
         filename: Optional[str] = None,
-        max_retries: int = 3,
+        max_retries: Optional[int] = None,
         model: Optional[str] = None
     ) -> Optional[str]:
         """
@@ -67,23 +102,28 @@ class AIImageGenerator:
             prompt: Text description of the image
             negative_prompt: Things to avoid in the image
             filename: Custom filename (auto-generated if None)
-            max_retries: Number of retry attempts if model is loading
+            max_retries: Deprecated and ignored; pass max_retries to __init__ instead
             model: Which model to use ('stable_diffusion', 'openjourney', 'realistic')
         
         Returns:
             Path to generated image file, or None if failed
         """
+        if max_retries is not None:
+            warnings.warn(
+                "generate_image(max_retries=...) is ignored; retries are configured "
+                "once via AIImageGenerator(max_retries=...)",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+
         if not self.api_key:
             print("❌ Cannot generate image: No API key configured")
             return None
         
         # Switch model if specified
         if model and model in self.models:
-            original_url = self.api_url
             self.set_model(model)
         
-        headers = {"Authorization": f"Bearer {self.api_key}"}
-        
         # Prepare payload
         payload = {
             "inputs": prompt,
@@ -97,76 +137,60 @@ class AIImageGenerator:
         print(f"   Model: {self.default_model}")
         print(f"   Prompt: {prompt[:80]}...")
         
-        # Try generating the image with retries
-        for attempt in range(max_retries):
-            try:
-                response = requests.post(self.api_url, headers=headers, json=payload, timeout=60)
-                
-                if response.status_code == 200:
-                    # Success! Save the image
-                    image_data = response.content
-                    
-                    # Generate filename if not provided
-                    if not filename:
-                        timestamp = int(time.time())
-                        filename = f"ai_generated_{timestamp}.png"
-                    
-                    # Ensure .png extension
-                    if not filename.endswith('.png'):
-                        filename += '.png'
-                    
-                    output_path = self.output_dir / filename
-                    
-                    # Save the image
-                    with open(output_path, 'wb') as f:
-                        f.write(image_data)
-                    
-                    # Verify it's a valid image
-                    try:
-                        img = Image.open(output_path)
-                        img.verify()
-                        print(f"✅ Image generated successfully: {output_path}")
-                        print(f"   Size: {img.size[0]}x{img.size[1]}")
-                        return str(output_path)
-                    except Exception as e:
-                        print(f"❌ Generated file is not a valid image: {e}")
-                        if output_path.exists():
-                            output_path.unlink()
-                        return None
-                
-                elif response.status_code == 503:
-                    # Model is loading, wait and retry
-                    error_data = response.json()
-                    wait_time = error_data.get('estimated_time', 20)
-                    print(f"⏳ Model is loading... waiting {wait_time}s (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(wait_time + 5)  # Add extra buffer
-                    continue
-                
-                else:
-                    # Other error
-                    print(f"❌ Error {response.status_code}: {response.text}")
-                    return None
-            
-            except requests.exceptions.Timeout:
-                print(f"⏰ Request timeout (attempt {attempt + 1}/{max_retries})")
-                if attempt < max_retries - 1:
-                    time.sleep(10)
-                    continue
-                return None
-            
-            except Exception as e:
-                print(f"❌ Error generating image: {e}")
-                return None
+        try:
+            # Retries (model loading, 5xx, timeouts) happen inside the session
+            response = self.session.post(self.api_url, json=payload, timeout=60)
+        except requests.exceptions.Timeout:
+            print("⏰ Request timeout")
+            return None
+        except Exception as e:
+            print(f"❌ Error generating image: {e}")
+            return None
+
+        if response.status_code != 200:
+            print(f"❌ Error {response.status_code}: {response.text}")
+            return None
+
+        # Success! Save the image
+        image_data = response.content
+        
+        # Generate filename if not provided
+        if not filename:
+            timestamp = int(time.time())
+            filename = f"ai_generated_{timestamp}.png"
         
-        print(f"❌ Failed to generate image after {max_retries} attempts")
-        return None
+        # Ensure .png extension
+        if not filename.endswith('.png'):
+            filename += '.png'
+        
+        output_path = self.output_dir / filename
+        
+        # Verify it's a valid image before anything touches disk. PNG/JPEG
+        # bytes (what the API normally returns) only need their header parsed
+        # for the size; anything else gets PIL's full verify().
+        try:
+            img = Image.open(io.BytesIO(image_data))
+            if not _sniff_image(image_data):
+                img.verify()
+        except Exception as e:
+            print(f"❌ Generated file is not a valid image: {e}")
+            return None
+        
+        # Save the image
+        with open(output_path, 'wb') as f:
+            f.write(image_data)
+        
+        print(f"✅ Image generated successfully: {output_path}")
+        print(f"   Size: {img.size[0]}x{img.size[1]}")
+        return str(output_path)
     
     def generate_batch(
         self, 
         prompts: list, 
         negative_prompt: str = '',
         model: Optional[str] = None,
-        delay: int = 3
+        delay: int = 3,
+        max_workers: int = 4
     ) -> list:
         """
         Generate multiple images from a list of prompts
@@ -175,38 +199,55 @@ class AIImageGenerator:
             prompts: List of text prompts
             negative_prompt: Things to avoid (applied to all)
             model: Which model to use
-            delay: Seconds to wait between requests (rate limiting)
+            delay: Minimum seconds between request starts (rate limiting)
+            max_workers: Requests kept in flight at once
         
         Returns:
             List of file paths for successfully generated images
         """
-        results = []
+        results = {}
         
         print(f"\n🎨 Batch Generation: {len(prompts)} images")
         print("=" * 60)
-        
-        for i, prompt in enumerate(prompts, 1):
+
+        # generate_image switches self.api_url when given a model, so pick it
+        # once here rather than racing on it from the workers
+        if model and model in self.models:
+            self.set_model(model)
+
+        # Space request starts `delay` seconds apart; workers only sleep when
+        # they would otherwise run ahead of that rate
+        pace_lock = threading.Lock()
+        next_start = [time.monotonic()]
+
+        def _one(i: int, prompt: str) -> Optional[str]:
+            with pace_lock:
+                wait = next_start[0] - time.monotonic()
+                next_start[0] = max(next_start[0], time.monotonic()) + delay
+            if wait > 0:
+                time.sleep(wait)
             print(f"\n[{i}/{len(prompts)}] Generating...")
-            
-            result = self.generate_image(
+            return self.generate_image(
                 prompt=prompt,
                 negative_prompt=negative_prompt,
                 filename=f"batch_{i}_{int(time.time())}.png",
-                model=model
             )
-            
-            if result:
-                results.append(result)
-            
-            # Rate limiting: wait between requests
-            if i < len(prompts):
-                print(f"   ⏳ Waiting {delay}s before next generation...")
-                time.sleep(delay)
+
+        with ThreadPoolExecutor(max_workers=max(1, int(max_workers))) as ex:
+            futures = {ex.submit(_one, i, p): i for i, p in enumerate(prompts, 1)}
+            for fut in as_completed(futures):
+                try:
+                    result = fut.result()
+                except Exception as e:
+                    print(f"❌ Error generating image: {e}")
+                    continue
+                if result:
+                    results[futures[fut]] = result
         
         print("\n" + "=" * 60)
         print(f"✅ Batch complete: {len(results)}/{len(prompts)} successful")
         
-        return results
+        return [results[i] for i in sorted(results)]
     
     def test_connection(self) -> bool:
         """Test if API key is valid and working"""
@@ -219,10 +260,9 @@ class AIImageGenerator:
         try:
             # Try a simple generation
             test_prompt = "simple blue sky with white clouds, minimalist"
-            headers = {"Authorization": f"Bearer {self.api_key}"}
             payload = {"inputs": test_prompt}
             
-            response = requests.post(self.api_url, headers=headers, json=payload, timeout=30)
+            response = self.session.post(self.api_url, json=payload, timeout=30)
             
             if response.status_code == 200:
                 print("✅ API connection successful!")
@@ -243,7 +283,10 @@ class AIImageGenerator:
 def generate_ai_image(prompt: str, api_key: Optional[str] = None) -> Optional[str]:
     """Quick function to generate a single AI image"""
     generator = AIImageGenerator(api_key=api_key)
-    return generator.generate_image(prompt)
+    try:
+        return generator.generate_image(prompt)
+    finally:
+        generator.close()
 
 
 # Main test script
@@ -271,21 +314,24 @@ if __name__ == '__main__':
         
         generator = AIImageGenerator(api_key=api_key)
         
-        # Test connection
-        if generator.test_connection():
-            print("\n🎨 Running test generation...")
-            
-            test_prompt = "beautiful mountain landscape at sunset, warm colors, peaceful atmosphere, digital art, no text, high quality"
-            
-            result = generator.generate_image(
-                prompt=test_prompt,
-                negative_prompt="text, words, watermark, blurry",
-                filename="test_image.png"
-            )
-            
-            if result:
-                print(f"\n🎉 SUCCESS! Test image saved to: {result}")
-            else:
-                print("\n❌ Test generation failed")
+        try:
+            # Test connection
+            if generator.test_connection():
+                print("\n🎨 Running test generation...")
+                
+                test_prompt = "beautiful mountain landscape at sunset, warm colors, peaceful atmosphere, digital art, no text, high quality"
+                
+                result = generator.generate_image(
+                    prompt=test_prompt,
+                    negative_prompt="text, words, watermark, blurry",
+                    filename="test_image.png"
+                )
+                
+                if result:
+                    print(f"\n🎉 SUCCESS! Test image saved to: {result}")
+                else:
+                    print("\n❌ Test generation failed")
+        finally:
+            generator.close()
         
         print("\n" + "=" * 80)
@@ -5,6 +5,7 @@ Analyzes quotes and generates detailed Text-to-Image prompts for AI generation
 """
 
 import re
+from functools import lru_cache
 from typing import Dict, Optional
 import json
 
@@ -12,6 +13,34 @@ import json
 class AIPromptGenerator:
     """Generate AI image prompts based on quote content and mood"""
     
+    # Scene description per primary theme
+    _SCENE_MAP = {
+        'nature': 'beautiful natural landscape with mountains and trees',
+        'wisdom': 'ancient library with glowing books and mystical atmosphere',
+        'love': 'romantic sunset scene with soft pink and purple hues',
+        'success': 'summit of a mountain at sunrise, achievement symbolism',
+        'motivation': 'person climbing upward, rays of light breaking through clouds',
+        'peace': 'zen garden with calm water reflection and cherry blossoms',
+        'life': 'winding path through a scenic landscape, journey symbolism',
+        'happiness': 'bright sunny meadow filled with colorful wildflowers',
+        'sadness': 'rainy window with soft droplets, melancholic atmosphere',
+        'hope': 'dawn breaking through darkness, light at the end of tunnel',
+        'darkness': 'starry night sky with deep blues and cosmic elements',
+        'light': 'sunbeams breaking through clouds, divine light effect',
+        'time': 'ethereal clockwork mechanism with flowing time elements',
+        'journey': 'scenic road stretching into horizon, adventure awaits',
+        'freedom': 'bird soaring in vast open sky, sense of liberation',
+    }
+
+    # Fixed tail of every full prompt
+    _PROMPT_SUFFIX = (
+        ', highly detailed, professional quality, 4k resolution,'
+        ' perfect for quote overlay, centered composition, no text or words'
+    )
+
+    # Things the image model should avoid
+    _NEGATIVE_PROMPT = 'text, words, letters, watermark, signature, blurry, low quality, distorted, busy background, cluttered, ugly, bad anatomy'
+
     def __init__(self):
         # Keyword mappings for different themes
         self.themes = {
@@ -53,82 +82,72 @@ class AIPromptGenerator:
             'vintage illustration',
             'modern graphic design',
         ]
+
+        # Mood indicator words, matched as substrings like the theme keywords
+        self.mood_words = {
+            'positive': ['love', 'joy', 'happy', 'success', 'peace', 'hope', 'beautiful',
+                         'wonderful', 'inspire', 'dream', 'smile', 'triumph', 'victory'],
+            'negative': ['pain', 'sorrow', 'sad', 'fear', 'dark', 'lonely', 'grief',
+                         'loss', 'tear', 'suffer', 'despair'],
+            'energetic': ['power', 'strong', 'energy', 'action', 'fight', 'rise',
+                          'conquer', 'achieve', 'passion'],
+            'calm': ['peace', 'calm', 'quiet', 'gentle', 'soft', 'tranquil',
+                     'serene', 'silence', 'meditation'],
+        }
+
+        # Set views for _analyze(): one pass over the keyword union finds every
+        # keyword in the quote, then themes/moods are set intersections
+        self._theme_sets = {t: frozenset(kws) for t, kws in self.themes.items()}
+        self._mood_sets = {m: frozenset(kws) for m, kws in self.mood_words.items()}
+        self._keywords = frozenset().union(*self._theme_sets.values(), *self._mood_sets.values())
+
+        # Prompts depend only on (quote, category); re-styling or regenerating a
+        # quote reuses the analysis. Per instance so the tables above are the key.
+        self._prompt_cache = lru_cache(maxsize=4096)(self._build_prompt)
     
-    def detect_themes(self, text: str) -> list:
-        """Detect themes present in the quote text"""
+    def _analyze(self, text: str) -> tuple:
+        """Themes and mood of the quote text in a single keyword scan"""
         text_lower = text.lower()
-        detected = []
-        
-        for theme, keywords in self.themes.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    if theme not in detected:
-                        detected.append(theme)
-                    break
-        
+        found = {k for k in self._keywords if k in text_lower}
+
+        themes = [t for t, kws in self._theme_sets.items() if not kws.isdisjoint(found)]
         # Default to 'life' if no theme detected
-        if not detected:
-            detected.append('life')
-        
-        return detected[:3]  # Return top 3 themes
+        if not themes:
+            themes.append('life')
+
+        moods = self._mood_sets
+        pos_count = len(moods['positive'] & found)
+        neg_count = len(moods['negative'] & found)
+        energy_count = len(moods['energetic'] & found)
+        calm_count = len(moods['calm'] & found)
+
+        # Determine dominant mood
+        if energy_count >= 2:
+            mood = 'energetic'
+        elif calm_count >= 2:
+            mood = 'calm'
+        elif pos_count > neg_count:
+            mood = 'positive'
+        elif neg_count > pos_count:
+            mood = 'negative'
+        else:
+            mood = 'neutral'
+
+        return themes[:3], mood  # Top 3 themes
+
+    def detect_themes(self, text: str) -> list:
+        """Detect themes present in the quote text"""
+        return self._analyze(text)[0]
     
     def analyze_mood(self, text: str) -> str:
         """Analyze the emotional mood of the quote"""
-        text_lower = text.lower()
-        
-        # Positive indicators
-        positive_words = ['love', 'joy', 'happy', 'success', 'peace', 'hope', 'beautiful', 
-                         'wonderful', 'inspire', 'dream', 'smile', 'triumph', 'victory']
-        # Negative indicators  
-        negative_words = ['pain', 'sorrow', 'sad', 'fear', 'dark', 'lonely', 'grief',
-                         'loss', 'tear', 'suffer', 'despair']
-        # Energetic indicators
-        energetic_words = ['power', 'strong', 'energy', 'action', 'fight', 'rise',
-                          'conquer', 'achieve', 'passion']
-        # Calm indicators
-        calm_words = ['peace', 'calm', 'quiet', 'gentle', 'soft', 'tranquil',
-                     'serene', 'silence', 'meditation']
-        
-        pos_count = sum(1 for word in positive_words if word in text_lower)
-        neg_count = sum(1 for word in negative_words if word in text_lower)
-        energy_count = sum(1 for word in energetic_words if word in text_lower)
-        calm_count = sum(1 for word in calm_words if word in text_lower)
-        
-        # Determine dominant mood
-        if energy_count >= 2:
-            return 'energetic'
-        if calm_count >= 2:
-            return 'calm'
-        if pos_count > neg_count:
-            return 'positive'
-        if neg_count > pos_count:
-            return 'negative'
-        
-        return 'neutral'
+        return self._analyze(text)[1]
     
     def get_scene_description(self, themes: list) -> str:
         """Generate scene description based on themes"""
-        scene_map = {
-            'nature': 'beautiful natural landscape with mountains and trees',
-            'wisdom': 'ancient library with glowing books and mystical atmosphere',
-            'love': 'romantic sunset scene with soft pink and purple hues',
-            'success': 'summit of a mountain at sunrise, achievement symbolism',
-            'motivation': 'person climbing upward, rays of light breaking through clouds',
-            'peace': 'zen garden with calm water reflection and cherry blossoms',
-            'life': 'winding path through a scenic landscape, journey symbolism',
-            'happiness': 'bright sunny meadow filled with colorful wildflowers',
-            'sadness': 'rainy window with soft droplets, melancholic atmosphere',
-            'hope': 'dawn breaking through darkness, light at the end of tunnel',
-            'darkness': 'starry night sky with deep blues and cosmic elements',
-            'light': 'sunbeams breaking through clouds, divine light effect',
-            'time': 'ethereal clockwork mechanism with flowing time elements',
-            'journey': 'scenic road stretching into horizon, adventure awaits',
-            'freedom': 'bird soaring in vast open sky, sense of liberation',
-        }
-        
         # Get description for primary theme
         primary_theme = themes[0] if themes else 'life'
-        return scene_map.get(primary_theme, 'inspiring abstract background')
+        return self._SCENE_MAP.get(primary_theme, 'inspiring abstract background')
     
     def generate_prompt(self, quote: str, author: str = '', category: str = '') -> Dict[str, str]:
         """
@@ -144,9 +163,12 @@ class AIPromptGenerator:
                 'color_scheme': 'Suggested colors'
             }
         """
+        # Copy so callers can't mutate the cached dict
+        return dict(self._prompt_cache(quote, category))
+
+    def _build_prompt(self, quote: str, category: str) -> Dict[str, str]:
         # Detect themes and mood
-        themes = self.detect_themes(quote)
-        mood = self.analyze_mood(quote)
+        themes, mood = self._analyze(quote)
         
         # Get scene and colors
         scene = self.get_scene_description(themes)
@@ -163,22 +185,10 @@ class AIPromptGenerator:
             style = 'digital art, professional and clean'
         
         # Build the complete prompt
-        prompt_parts = [
-            scene,
-            colors,
-            style,
-            'highly detailed',
-            'professional quality',
-            '4k resolution',
-            'perfect for quote overlay',
-            'centered composition',
-            'no text or words',
-        ]
-        
-        full_prompt = ', '.join(prompt_parts)
+        full_prompt = f"{scene}, {colors}, {style}{self._PROMPT_SUFFIX}"
         
         # Negative prompt (things to avoid)
-        negative_prompt = 'text, words, letters, watermark, signature, blurry, low quality, distorted, busy background, cluttered, ugly, bad anatomy'
+        negative_prompt = self._NEGATIVE_PROMPT
         
         return {
             'prompt': full_prompt,
@@ -192,8 +202,7 @@ class AIPromptGenerator:
     
     def generate_simple_prompt(self, quote: str) -> str:
         """Generate a simple one-line prompt for quick use"""
-        themes = self.detect_themes(quote)
-        mood = self.analyze_mood(quote)
+        themes, mood = self._analyze(quote)
         scene = self.get_scene_description(themes)
         colors = self.color_schemes.get(mood, 'natural colors')
         
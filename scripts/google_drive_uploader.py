@@ -6,7 +6,7 @@ Uploads images to Google Drive and returns shareable links
 
 from google.oauth2.service_account import Credentials
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.http import MediaIoBaseUpload
 from pathlib import Path
 
 class DriveUploader:
@@ -15,6 +15,7 @@ class DriveUploader:
         self.credentials_path = credentials_path
         self.service = None
         self.root_folder_id = None
+        self._folder_ids = {}
         
     def connect(self):
         """Connect to Google Drive API"""
@@ -75,11 +76,15 @@ class DriveUploader:
             return None
     
     def get_or_create_folder(self, folder_name, parent_id=None):
-        """Get existing folder or create new one"""
-        folder_id = self.find_folder(folder_name, parent_id)
+        """Get existing folder or create new one (remembered per uploader)"""
+        key = (folder_name, parent_id)
+        folder_id = self._folder_ids.get(key)
         if folder_id:
             return folder_id
-        return self.create_folder(folder_name, parent_id)
+        folder_id = self.find_folder(folder_name, parent_id) or self.create_folder(folder_name, parent_id)
+        if folder_id:
+            self._folder_ids[key] = folder_id
+        return folder_id
     
     def upload_image(self, image_path, topic=None):
         """Upload an image to Drive"""
@@ -104,17 +109,17 @@ class DriveUploader:
                 'parents': [parent_id]
             }
             
-            media = MediaFileUpload(
-                str(image_path),
-                mimetype='image/png',
-                resumable=True
-            )
-            
-            file = self.service.files().create(
-                body=file_metadata,
-                media_body=media,
-                fields='id, webViewLink, webContentLink'
-            ).execute()
+            # Quote images are a few hundred KB: a single multipart request
+            # beats a resumable session (extra initiation round-trip + chunks).
+            # The handle is scoped to the request so it is closed right away
+            # instead of whenever the media object is garbage-collected.
+            with open(image_path, 'rb') as fh:
+                media = MediaIoBaseUpload(fh, mimetype='image/png', resumable=False)
+                file = self.service.files().create(
+                    body=file_metadata,
+                    media_body=media,
+                    fields='id, webViewLink, webContentLink'
+                ).execute()
             
             # Make file publicly accessible
             self.service.permissions().create(
@@ -7,16 +7,26 @@ Creates beautiful quote images with multiple design styles and templates
 - 12+ design templates
 """
 
-from PIL import Image, ImageDraw, ImageFont, ImageFilter, ImageChops, ImageEnhance
+from PIL import Image, ImageDraw, ImageFont, ImageFilter, ImageChops, ImageEnhance, ImageColor
 from pathlib import Path
 import textwrap
 import random
 import io
-import urllib.request
 import math
 import time
+import functools
 from colorsys import rgb_to_hls, hls_to_rgb
 
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    _REQUESTS_OK = True
+except Exception:
+    requests = None
+    _REQUESTS_OK = False
+    import urllib.request
+
 try:
     import arabic_reshaper
     from bidi.algorithm import get_display
@@ -26,6 +36,113 @@ except Exception:
     get_display = None
     _RTL_OK = False
 
+
+_HTTP_SESSION = None
+
+
+def _http_session():
+    """Shared keep-alive session for avatar downloads (one TLS handshake per host)"""
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=8, pool_maxsize=8,
+            max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        _HTTP_SESSION = session
+    return _HTTP_SESSION
+
+
+@functools.lru_cache(maxsize=64)
+def _load_font(path, size):
+    """Load a TrueType font once per (path, size); None if it can't be opened"""
+    try:
+        return ImageFont.truetype(path, size)
+    except Exception:
+        return None
+
+
+def _list_assets(folder, patterns):
+    """Sorted files in folder matching any glob pattern, re-listed only when
+    the directory's mtime changes (files added/removed)"""
+    folder = Path(folder)
+    try:
+        mtime_ns = folder.stat().st_mtime_ns
+    except OSError:
+        return []
+    return _cached_listing(str(folder), mtime_ns, tuple(patterns))
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_listing(folder, mtime_ns, patterns):
+    files = []
+    for pattern in patterns:
+        files.extend(Path(folder).glob(pattern))
+    return sorted(files)
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_watermark(path, mtime_ns, max_size=None):
+    """Decoded RGBA watermark, optionally thumbnailed to max_size.
+
+    Shared between calls - copy before mutating. mtime_ns is part of the key
+    so a replaced file is picked up.
+    """
+    with Image.open(path) as src:
+        wm = src.convert('RGBA')
+    if max_size:
+        wm.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+    return wm
+
+
+@functools.lru_cache(maxsize=128)
+def _hex_to_rgb(color):
+    """Convert '#RRGGBB' to an (r, g, b) tuple (memoized - palettes are small)"""
+    return (int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16))
+
+
+def _vertical_gradient(width, height, stops, scale_first=False):
+    """Render a top-to-bottom multi-stop gradient.
+
+    Args:
+        stops: ((row, (r, g, b)), ...) in ascending row order. Rows between
+            two stops are interpolated linearly; rows past the last stop
+            take its colour.
+        scale_first: evaluate a + (b - a) * (y - y0) / span instead of
+            a + (b - a) * t. The two round differently on a few rows; each
+            style keeps the order its per-scanline loop used.
+
+    Returns a fresh image the caller is free to draw on.
+    """
+    return _cached_vertical_gradient(width, height, tuple(stops), bool(scale_first)).copy()
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_vertical_gradient(width, height, stops, scale_first=False):
+    """Memoized gradient render - never draw on the result, copy it first.
+
+    Colours are computed once per row into a 1px-wide strip which Pillow
+    then stretches to full width, instead of one draw call per scanline.
+    """
+    rows = bytearray()
+    seg = 0
+    for y in range(height):
+        while seg < len(stops) - 2 and y >= stops[seg + 1][0]:
+            seg += 1
+        (y0, c0), (y1, c1) = stops[seg], stops[seg + 1]
+        span = max(1, y1 - y0)
+        if scale_first:
+            dy = min(y, y1) - y0
+            rows += bytes(int(a + (b - a) * dy / span) for a, b in zip(c0, c1))
+        else:
+            t = min(1.0, (y - y0) / span)
+            rows += bytes(int(a + (b - a) * t) for a, b in zip(c0, c1))
+    strip = Image.frombytes('RGB', (1, height), bytes(rows))
+    return strip.resize((width, height), Image.Resampling.NEAREST)
+
+
 class QuoteImageGenerator:
     def __init__(self, output_dir="Generated_Images", watermark_dir="Watermarks"):
         self.output_dir = Path(output_dir)
@@ -46,6 +163,11 @@ class QuoteImageGenerator:
         self.quote_font_size = 52
         self.author_font_size = 30
 
+        # AI background clients, created on first use and kept so their
+        # HTTP connections are reused across a bulk run
+        self._ai_prompt_gen = None
+        self._ai_image_gens = {}
+
         # Design styles - Enhanced with more options
         self.styles = {
             'elegant': self.elegant_style,
@@ -105,15 +227,11 @@ class QuoteImageGenerator:
 
     def get_font(self, size, bold=False):
         """Get a font, falling back to default if custom fonts unavailable"""
-        try:
-            if self._selected_font_regular_path:
-                font_path = self._selected_font_bold_path if bold else self._selected_font_regular_path
-                return ImageFont.truetype(str(font_path), size)
-            if bold:
-                return ImageFont.truetype("arial.ttf", size)
-            return ImageFont.truetype("arial.ttf", size)
-        except:
-            return ImageFont.load_default()
+        if self._selected_font_regular_path:
+            font_path = self._selected_font_bold_path if bold else self._selected_font_regular_path
+        else:
+            font_path = "arial.ttf"
+        return _load_font(str(font_path), size) or ImageFont.load_default()
 
     def extract_dominant_color(self, image):
         """Extract dominant color from image for color-matching"""
@@ -157,8 +275,13 @@ class QuoteImageGenerator:
             
             # Load avatar image
             if str(author_image).strip().lower().startswith('http'):
-                with urllib.request.urlopen(str(author_image).strip(), timeout=6) as resp:
-                    data = resp.read()
+                if _REQUESTS_OK:
+                    resp = _http_session().get(str(author_image).strip(), timeout=6)
+                    resp.raise_for_status()
+                    data = resp.content
+                else:
+                    with urllib.request.urlopen(str(author_image).strip(), timeout=6) as resp:
+                        data = resp.read()
                 avatar = Image.open(io.BytesIO(data)).convert('RGBA')
             else:
                 avatar = Image.open(str(author_image)).convert('RGBA')
@@ -221,24 +344,52 @@ class QuoteImageGenerator:
         words = text.split()
         lines = []
         current_line = []
+        current_width = 0
+
+        # Measure each distinct word once and keep a running line width
+        word_w = {w: font.getlength(w) for w in set(words)}
+        space_w = font.getlength(' ')
 
         for word in words:
-            current_line.append(word)
-            test_line = ' '.join(current_line)
-            bbox = font.getbbox(test_line)
-            if bbox[2] > max_width:
-                if len(current_line) == 1:
-                    lines.append(current_line.pop())
-                else:
-                    current_line.pop()
+            width = current_width + space_w + word_w[word] if current_line else word_w[word]
+            if width > max_width:
+                if current_line:
                     lines.append(' '.join(current_line))
-                    current_line = [word]
+                if word_w[word] > max_width:
+                    lines.append(word)
+                    current_line, current_width = [], 0
+                else:
+                    current_line, current_width = [word], word_w[word]
+            else:
+                current_line.append(word)
+                current_width = width
 
         if current_line:
             lines.append(' '.join(current_line))
 
         return lines
 
+    def _draw_shadowed_text(self, img, xy, text, font, fill, shadow_fill, offset, blur=2):
+        """Draw text over a soft drop shadow from a single glyph rasterization.
+
+        The text is rendered once into a padded 'L' mask. A Gaussian-blurred
+        copy is pasted in the shadow colour at the offset (its alpha
+        honoured), then the sharp mask in the text colour on top.
+        """
+        x, y = xy
+        pad = blur * 3
+        bbox = font.getbbox(text)
+        mask = Image.new('L', (max(1, bbox[2]) + 2 * pad, max(1, bbox[3]) + 2 * pad), 0)
+        ImageDraw.Draw(mask).text((pad, pad), text, fill=255, font=font)
+
+        shadow_rgba = ImageColor.getrgb(shadow_fill)
+        alpha = shadow_rgba[3] if len(shadow_rgba) == 4 else 255
+        shadow_mask = mask.filter(ImageFilter.GaussianBlur(blur)) if blur else mask
+        if alpha != 255:
+            shadow_mask = shadow_mask.point(lambda p: p * alpha // 255)
+        img.paste(shadow_rgba[:3], (x + offset - pad, y + offset - pad), shadow_mask)
+        img.paste(ImageColor.getrgb(fill)[:3], (x - pad, y - pad), mask)
+
     def _prep_text(self, text: str, language: str | None = None) -> str:
         lang = str(language or '').strip().lower()
         if lang not in ('ur', 'urdu', 'ar', 'arabic'):
@@ -253,7 +404,7 @@ class QuoteImageGenerator:
 
     def _pick_watermark_file(self, mode: str = 'corner', style: str = '') -> Path:
         import random
-        watermark_files = sorted(self.watermark_dir.glob('*.png'))
+        watermark_files = _list_assets(self.watermark_dir, ('*.png',))
         if not watermark_files:
             return None
         # Use random selection instead of deterministic hash
@@ -275,13 +426,16 @@ class QuoteImageGenerator:
             return image
 
         try:
-            watermark = Image.open(watermark_path).convert('RGBA')
+            wm_key = (str(watermark_path), watermark_path.stat().st_mtime_ns)
+            watermark = _cached_watermark(*wm_key)
+            tinted = False
 
             # Color-match mode
             if mode == 'color-match' or color_match:
                 dominant = self.extract_dominant_color(image)
                 # Tint watermark to match image
                 watermark = self._tint_image(watermark, dominant)
+                tinted = True
                 opacity = 0.5  # Lower opacity for color-matched
 
             # Stripe mode
@@ -315,7 +469,10 @@ class QuoteImageGenerator:
                 return Image.alpha_composite(base, tile)
 
             max_size = max(32, int(min(self.width, self.height) * float(size_percent or 0.15)))
-            watermark.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+            if tinted:
+                watermark.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+            else:
+                watermark = _cached_watermark(*wm_key, max_size)
 
             pad = 30
             pos_key = str(position or 'bottom-right').strip().lower()
@@ -374,23 +531,19 @@ class QuoteImageGenerator:
     def _tint_image(self, image, color):
         """Tint an RGBA image with a color"""
         r, g, b = color
-        tinted = image.copy()
-        tinted_data = tinted.getdata()
-        
-        new_data = []
-        for item in tinted_data:
-            if item[3] > 0:  # If not transparent
-                new_data.append((
-                    min(255, (item[0] + r) // 2),
-                    min(255, (item[1] + g) // 2),
-                    min(255, (item[2] + b) // 2),
-                    item[3]
-                ))
-            else:
-                new_data.append(item)
-        
-        tinted.putdata(new_data)
-        return tinted
+        red, green, blue, alpha = image.split()
+
+        # Average each channel with the tint via a lookup table, then apply it
+        # only where the watermark isn't fully transparent
+        tinted = Image.merge('RGBA', (
+            red.point(lambda v: (v + r) // 2),
+            green.point(lambda v: (v + g) // 2),
+            blue.point(lambda v: (v + b) // 2),
+            alpha,
+        ))
+        result = image.copy()
+        result.paste(tinted, mask=alpha.point(lambda p: 255 if p > 0 else 0))
+        return result
 
     def generate(self, quote, author, style='minimal', category='', add_watermark=True, author_image: str = '', 
                  watermark_mode: str = 'corner', watermark_opacity: float = None, watermark_blend: str = 'normal', avatar_position: str = 'top-left', font_name: str = None,
@@ -486,7 +639,9 @@ class QuoteImageGenerator:
             output_path = self.output_dir / filename
             if img.mode != 'RGB':
                 img = img.convert('RGB')
-            img.save(output_path, format='PNG', quality=95)
+            # PNG ignores quality=; zlib level 1 encodes several times faster
+            # than the default 6 for a few percent more bytes
+            img.save(output_path, format='PNG', compress_level=1)
             return str(output_path)
         finally:
             self._selected_font_regular_path = prev_regular
@@ -498,9 +653,13 @@ class QuoteImageGenerator:
             if not p.exists():
                 return None
             bg = Image.open(str(p))
+            # Large JPEGs decode directly at the smallest DCT scale that still
+            # covers the canvas (no-op for other formats)
+            bg.draft('RGB', (self.width, self.height))
             if bg.mode not in ('RGB', 'RGBA'):
                 bg = bg.convert('RGB')
-            bg = bg.resize((self.width, self.height), Image.Resampling.LANCZOS)
+            # reducing_gap box-reduces big downscales before the LANCZOS pass
+            bg = bg.resize((self.width, self.height), Image.Resampling.LANCZOS, reducing_gap=3.0)
             return bg
         except Exception:
             return None
@@ -508,15 +667,10 @@ class QuoteImageGenerator:
     def _resolve_background_path(self, mode: str, quote: str, author: str, category: str, ai_model: str | None = None, hf_api_key: str | None = None) -> str | None:
         m = str(mode or 'none').strip().lower()
         if m == 'custom':
-            folder = Path('assets') / 'custom_backgrounds'
-            if not folder.exists():
-                return None
-            files = []
-            for ext in ('*.jpg', '*.jpeg', '*.png'):
-                files.extend(folder.glob(ext))
+            files = _list_assets(Path('assets') / 'custom_backgrounds', ('*.jpg', '*.jpeg', '*.png'))
             if not files:
                 return None
-            return str(random.choice(sorted(files)))
+            return str(random.choice(files))
 
         if m == 'ai':
             try:
@@ -525,16 +679,22 @@ class QuoteImageGenerator:
             except Exception:
                 return None
 
-            prompt_gen = AIPromptGenerator()
-            prompt_data = prompt_gen.generate_prompt(quote=quote, author=author, category=category)
+            if self._ai_prompt_gen is None:
+                self._ai_prompt_gen = AIPromptGenerator()
+            prompt_data = self._ai_prompt_gen.generate_prompt(quote=quote, author=author, category=category)
 
-            generator = AIImageGenerator(api_key=str(hf_api_key) if hf_api_key else None)
+            key = str(hf_api_key) if hf_api_key else None
+            generator = self._ai_image_gens.get(key)
+            if generator is None:
+                generator = self._ai_image_gens[key] = AIImageGenerator(api_key=key)
             filename = f"ai_generated_{int(time.time())}.png"
             out = generator.generate_image(
                 prompt=str(prompt_data.get('prompt') or ''),
                 negative_prompt=str(prompt_data.get('negative_prompt') or ''),
                 filename=filename,
-                model=str(ai_model) if ai_model else None,
+                # generate_image keeps the last model on the instance, so always
+                # name one now that the client is reused
+                model=str(ai_model) if ai_model else 'stable_diffusion',
             )
             return str(out) if out else None
 
@@ -571,9 +731,6 @@ class QuoteImageGenerator:
     
     def bright_style(self, quote, author):
         """Bright vibrant gradient background"""
-        img = Image.new('RGB', (self.width, self.height))
-        draw = ImageDraw.Draw(img)
-        
         colors = [
             ('#FF6B6B', '#4ECDC4'),
             ('#A8E6CF', '#FFD3B6'),
@@ -582,15 +739,11 @@ class QuoteImageGenerator:
         ]
         color_pair = random.choice(colors)
         
-        for y in range(self.height):
-            r1, g1, b1 = int(color_pair[0][1:3], 16), int(color_pair[0][3:5], 16), int(color_pair[0][5:7], 16)
-            r2, g2, b2 = int(color_pair[1][1:3], 16), int(color_pair[1][3:5], 16), int(color_pair[1][5:7], 16)
-            
-            r = int(r1 + (r2 - r1) * y / self.height)
-            g = int(g1 + (g2 - g1) * y / self.height)
-            b = int(b1 + (b2 - b1) * y / self.height)
-            
-            draw.rectangle([(0, y), (self.width, y+1)], fill=(r, g, b))
+        img = _vertical_gradient(self.width, self.height, (
+            (0, _hex_to_rgb(color_pair[0])),
+            (self.height, _hex_to_rgb(color_pair[1])),
+        ), scale_first=True)
+        draw = ImageDraw.Draw(img)
         
         quote_font = self.get_font(self.quote_font_size, bold=True)
         author_font = self.get_font(self.author_font_size)
@@ -720,21 +873,15 @@ class QuoteImageGenerator:
     
     def neon_style(self, quote, author):
         """Futuristic neon design with glow"""
-        img = Image.new('RGB', (self.width, self.height), color='#070816')
-        draw = ImageDraw.Draw(img)
-
         accent_colors = ['#00D2FF', '#FF6B9D', '#C471ED', '#12CBC4']
         a1 = random.choice(accent_colors)
         a2 = random.choice([c for c in accent_colors if c != a1])
 
-        for y in range(self.height):
-            t = y / max(1, self.height - 1)
-            r1, g1, b1 = int(a1[1:3], 16), int(a1[3:5], 16), int(a1[5:7], 16)
-            r2, g2, b2 = int(a2[1:3], 16), int(a2[3:5], 16), int(a2[5:7], 16)
-            r = int(r1 + (r2 - r1) * t)
-            g = int(g1 + (g2 - g1) * t)
-            b = int(b1 + (b2 - b1) * t)
-            draw.rectangle([(0, y), (self.width, y + 1)], fill=(r // 10, g // 10, b // 10))
+        # Accent gradient dimmed to 10% brightness
+        img = _vertical_gradient(self.width, self.height, (
+            (0, _hex_to_rgb(a1)),
+            (max(1, self.height - 1), _hex_to_rgb(a2)),
+        )).point(lambda p: p // 10)
 
         ring = Image.new('RGBA', (self.width, self.height), (0, 0, 0, 0))
         rd = ImageDraw.Draw(ring)
@@ -774,9 +921,6 @@ class QuoteImageGenerator:
     
     def gradient_sunset_style(self, quote, author):
         """Beautiful sunset gradient with warm colors"""
-        img = Image.new('RGB', (self.width, self.height))
-        draw = ImageDraw.Draw(img)
-        
         # Sunset gradients
         gradients = [
             ('#FF6B35', '#F7931E', '#FDC830'),  # Orange sunset
@@ -785,23 +929,14 @@ class QuoteImageGenerator:
         ]
         colors = random.choice(gradients)
         
-        # Multi-stop gradient
-        for y in range(self.height):
-            if y < self.height // 3:
-                # Top third
-                t = y / (self.height // 3)
-                r1, g1, b1 = int(colors[0][1:3], 16), int(colors[0][3:5], 16), int(colors[0][5:7], 16)
-                r2, g2, b2 = int(colors[1][1:3], 16), int(colors[1][3:5], 16), int(colors[1][5:7], 16)
-            else:
-                # Bottom two-thirds
-                t = (y - self.height // 3) / (2 * self.height // 3)
-                r1, g1, b1 = int(colors[1][1:3], 16), int(colors[1][3:5], 16), int(colors[1][5:7], 16)
-                r2, g2, b2 = int(colors[2][1:3], 16), int(colors[2][3:5], 16), int(colors[2][5:7], 16)
-            
-            r = int(r1 + (r2 - r1) * t)
-            g = int(g1 + (g2 - g1) * t)
-            b = int(b1 + (b2 - b1) * t)
-            draw.rectangle([(0, y), (self.width, y+1)], fill=(r, g, b))
+        # Multi-stop gradient: top third, then bottom two-thirds
+        third = self.height // 3
+        img = _vertical_gradient(self.width, self.height, (
+            (0, _hex_to_rgb(colors[0])),
+            (third, _hex_to_rgb(colors[1])),
+            (third + 2 * self.height // 3, _hex_to_rgb(colors[2])),
+        ))
+        draw = ImageDraw.Draw(img)
         
         quote_font = self.get_font(self.quote_font_size, bold=True)
         author_font = self.get_font(self.author_font_size)
@@ -814,10 +949,7 @@ class QuoteImageGenerator:
             bbox = draw.textbbox((0, 0), line, font=quote_font)
             text_width = bbox[2] - bbox[0]
             x = (self.width - text_width) // 2
-            # Shadow
-            draw.text((x+3, y+3), line, fill='#00000040', font=quote_font)
-            # Main text
-            draw.text((x, y), line, fill='#FFFFFF', font=quote_font)
+            self._draw_shadowed_text(img, (x, y), line, quote_font, '#FFFFFF', '#00000040', 3)
             y += 75
         
         y += 50
@@ -825,8 +957,7 @@ class QuoteImageGenerator:
         bbox = draw.textbbox((0, 0), author_text, font=author_font)
         text_width = bbox[2] - bbox[0]
         x = (self.width - text_width) // 2
-        draw.text((x+2, y+2), author_text, fill='#00000030', font=author_font)
-        draw.text((x, y), author_text, fill='#FFFFFF', font=author_font)
+        self._draw_shadowed_text(img, (x, y), author_text, author_font, '#FFFFFF', '#00000030', 2)
         
         return img
     
@@ -874,15 +1005,15 @@ class QuoteImageGenerator:
         img = Image.new('RGB', (self.width, self.height), color=bg_color)
         draw = ImageDraw.Draw(img)
         
-        # Add vintage texture (noise)
+        # Add vintage texture (noise) through a PixelAccess handle rather
+        # than per-call getpixel/putpixel
         import random as rand
+        px = img.load()
         for _ in range(2000):
             x = rand.randint(0, self.width-1)
             y = rand.randint(0, self.height-1)
             brightness = rand.randint(-20, 20)
-            current = img.getpixel((x, y))
-            new_color = tuple(max(0, min(255, c + brightness)) for c in current)
-            img.putpixel((x, y), new_color)
+            px[x, y] = tuple(max(0, min(255, c + brightness)) for c in px[x, y])
         
         draw = ImageDraw.Draw(img)
         
@@ -926,9 +1057,6 @@ class QuoteImageGenerator:
     
     def nature_style(self, quote, author):
         """Nature-inspired green gradients"""
-        img = Image.new('RGB', (self.width, self.height))
-        draw = ImageDraw.Draw(img)
-        
         # Nature gradients
         gradients = [
             ('#134E5E', '#71B280'),  # Deep teal to sage
@@ -937,26 +1065,19 @@ class QuoteImageGenerator:
         ]
         colors = random.choice(gradients)
         
-        for y in range(self.height):
-            r1, g1, b1 = int(colors[0][1:3], 16), int(colors[0][3:5], 16), int(colors[0][5:7], 16)
-            r2, g2, b2 = int(colors[1][1:3], 16), int(colors[1][3:5], 16), int(colors[1][5:7], 16)
-            
-            t = y / self.height
-            r = int(r1 + (r2 - r1) * t)
-            g = int(g1 + (g2 - g1) * t)
-            b = int(b1 + (b2 - b1) * t)
-            
-            draw.rectangle([(0, y), (self.width, y+1)], fill=(r, g, b))
+        img = _vertical_gradient(self.width, self.height, (
+            (0, _hex_to_rgb(colors[0])),
+            (self.height, _hex_to_rgb(colors[1])),
+        ))
         
-        # Add subtle leaf pattern
-        overlay = Image.new('RGBA', (self.width, self.height), (255, 255, 255, 0))
-        overlay_draw = ImageDraw.Draw(overlay)
+        # Add subtle leaf pattern - a few small translucent shapes are blended
+        # straight onto the RGB image rather than composited from a full layer
+        overlay_draw = ImageDraw.Draw(img, 'RGBA')
         for i in range(5):
             x = random.randint(0, self.width)
             y = random.randint(0, self.height)
             overlay_draw.ellipse([(x, y), (x+30, y+50)], fill=(255, 255, 255, 15))
         
-        img = Image.alpha_composite(img.convert('RGBA'), overlay).convert('RGB')
         draw = ImageDraw.Draw(img)
         
         quote_font = self.get_font(self.quote_font_size, bold=True)
@@ -983,9 +1104,6 @@ class QuoteImageGenerator:
     
     def ocean_style(self, quote, author):
         """Ocean waves blue gradients"""
-        img = Image.new('RGB', (self.width, self.height))
-        draw = ImageDraw.Draw(img)
-        
         # Ocean gradients
         gradients = [
             ('#2E3192', '#1BFFFF'),  # Deep blue to cyan
@@ -994,24 +1112,16 @@ class QuoteImageGenerator:
         ]
         colors = random.choice(gradients)
         
-        for y in range(self.height):
-            r1, g1, b1 = int(colors[0][1:3], 16), int(colors[0][3:5], 16), int(colors[0][5:7], 16)
-            r2, g2, b2 = int(colors[1][1:3], 16), int(colors[1][3:5], 16), int(colors[1][5:7], 16)
-            
-            t = y / self.height
-            r = int(r1 + (r2 - r1) * t)
-            g = int(g1 + (g2 - g1) * t)
-            b = int(b1 + (b2 - b1) * t)
-            
-            draw.rectangle([(0, y), (self.width, y+1)], fill=(r, g, b))
+        img = _vertical_gradient(self.width, self.height, (
+            (0, _hex_to_rgb(colors[0])),
+            (self.height, _hex_to_rgb(colors[1])),
+        ))
         
-        # Add wave pattern
-        overlay = Image.new('RGBA', (self.width, self.height), (255, 255, 255, 0))
-        overlay_draw = ImageDraw.Draw(overlay)
+        # Add wave pattern (blended in place, see nature_style)
+        overlay_draw = ImageDraw.Draw(img, 'RGBA')
         for i in range(0, self.height, 100):
             overlay_draw.arc([(0, i-50), (self.width, i+50)], 0, 180, fill=(255, 255, 255, 20), width=3)
         
-        img = Image.alpha_composite(img.convert('RGBA'), overlay).convert('RGB')
         draw = ImageDraw.Draw(img)
         
         quote_font = self.get_font(54, bold=True)
@@ -1024,8 +1134,7 @@ class QuoteImageGenerator:
             bbox = draw.textbbox((0, 0), line, font=quote_font)
             text_width = bbox[2] - bbox[0]
             x = (self.width - text_width) // 2
-            draw.text((x+2, y+2), line, fill='#00000040', font=quote_font)
-            draw.text((x, y), line, fill='#FFFFFF', font=quote_font)
+            self._draw_shadowed_text(img, (x, y), line, quote_font, '#FFFFFF', '#00000040', 2)
             y += 74
         
         y += 50
@@ -1033,8 +1142,7 @@ class QuoteImageGenerator:
         bbox = draw.textbbox((0, 0), author_text, font=author_font)
         text_width = bbox[2] - bbox[0]
         x = (self.width - text_width) // 2
-        draw.text((x+2, y+2), author_text, fill='#00000030', font=author_font)
-        draw.text((x, y), author_text, fill='#FFFFFF', font=author_font)
+        self._draw_shadowed_text(img, (x, y), author_text, author_font, '#FFFFFF', '#00000030', 2)
         
         return img
     
@@ -1058,7 +1166,7 @@ class QuoteImageGenerator:
         
         colors = ['#8E2DE2', '#4A00E0', '#FF6B6B', '#00D2FF']
         for i, color in enumerate(colors):
-            r, g, b = int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
+            r, g, b = _hex_to_rgb(color)
             overlay_draw.ellipse([
                 (rand.randint(-200, self.width), rand.randint(-200, self.height)),
                 (rand.randint(0, self.width+200), rand.randint(0, self.height+200))
@@ -1147,16 +1255,14 @@ class QuoteImageGenerator:
         ]
         colors = random.choice(color_pairs)
         
-        # Diagonal split
+        # Diagonal split (colours and slope resolved once, not per row)
         split_angle = 25
+        slope = math.tan(math.radians(split_angle))
+        left_rgb, right_rgb = _hex_to_rgb(colors[0]), _hex_to_rgb(colors[1])
         for y in range(self.height):
-            split_x = int(self.width * 0.3 + y * math.tan(math.radians(split_angle)))
-            
-            r1, g1, b1 = int(colors[0][1:3], 16), int(colors[0][3:5], 16), int(colors[0][5:7], 16)
-            r2, g2, b2 = int(colors[1][1:3], 16), int(colors[1][3:5], 16), int(colors[1][5:7], 16)
-            
-            draw.rectangle([(0, y), (split_x, y+1)], fill=(r1, g1, b1))
-            draw.rectangle([(split_x, y), (self.width, y+1)], fill=(r2, g2, b2))
+            split_x = int(self.width * 0.3 + y * slope)
+            draw.rectangle([(0, y), (split_x, y+1)], fill=left_rgb)
+            draw.rectangle([(split_x, y), (self.width, y+1)], fill=right_rgb)
         
         quote_font = self.get_font(52, bold=True)
         author_font = self.get_font(30)
@@ -1168,8 +1274,7 @@ class QuoteImageGenerator:
             bbox = draw.textbbox((0, 0), line, font=quote_font)
             text_width = bbox[2] - bbox[0]
             x = (self.width - text_width) // 2
-            draw.text((x+2, y+2), line, fill='#00000040', font=quote_font)
-            draw.text((x, y), line, fill='#FFFFFF', font=quote_font)
+            self._draw_shadowed_text(img, (x, y), line, quote_font, '#FFFFFF', '#00000040', 2)
             y += 72
         
         y += 48
@@ -1177,8 +1282,7 @@ class QuoteImageGenerator:
         bbox = draw.textbbox((0, 0), author_text, font=author_font)
         text_width = bbox[2] - bbox[0]
         x = (self.width - text_width) // 2
-        draw.text((x+2, y+2), author_text, fill='#00000030', font=author_font)
-        draw.text((x, y), author_text, fill='#FFFFFF', font=author_font)
+        self._draw_shadowed_text(img, (x, y), author_text, author_font, '#FFFFFF', '#00000030', 2)
         
         return img
     
@@ -1196,7 +1300,7 @@ class QuoteImageGenerator:
         import random as rand
         for _ in range(8):
             color = random.choice(colors)
-            r, g, b = int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
+            r, g, b = _hex_to_rgb(color)
             
             shape_type = rand.choice(['circle', 'square', 'triangle'])
             x = rand.randint(0, self.width)
@@ -1258,7 +1362,7 @@ class QuoteImageGenerator:
         import random as rand
         for _ in range(50):
             color = random.choice([color_pair[0], color_pair[1]])
-            r, g, b = int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
+            r, g, b = _hex_to_rgb(color)
             
             x = rand.randint(-100, self.width+100)
             y = rand.randint(-100, self.height+100)
@@ -9,16 +9,30 @@ import gspread
 from google.oauth2.service_account import Credentials
 import os
 import json
+import time
 from pathlib import Path
 from typing import Any, Optional
 from datetime import datetime
 
+def _cell(row: list, cols: dict, *keys: str, default: Any = None) -> Any:
+    """First non-empty value among the header aliases in keys"""
+    for k in keys:
+        i = cols.get(k)
+        if i is not None and i < len(row) and row[i] not in (None, ""):
+            return row[i]
+    return default
+
+
+QUOTES_CACHE_TTL = 300.0  # seconds a topic's quote list is reused before re-reading the sheet
+
+
 class SheetReader:
     def __init__(self, credentials_path="credentials.json"):
         """Initialize with Google credentials"""
         self.credentials_path = credentials_path
         self.client = None
         self.spreadsheet = None
+        self._worksheet = None
         self.cache = {}
         self.config = {}
 
@@ -33,6 +47,22 @@ class SheetReader:
     def _get_database_worksheet_name(self) -> str:
         return "Database"  # Fixed to use the correct worksheet name
 
+    def _database_worksheet(self):
+        """Database worksheet handle, looked up once per connection"""
+        if self._worksheet is None:
+            self._worksheet = self.spreadsheet.worksheet(self._get_database_worksheet_name())
+        return self._worksheet
+
+    def _read_database(self):
+        """Read the Database sheet in one call: ({header: column index}, data rows)"""
+        values = self._database_worksheet().get_all_values()
+        if not values:
+            return {}, []
+        cols = {}
+        for i, header in enumerate(values[0]):
+            cols.setdefault(header, i)
+        return cols, values[1:]
+
     def _col_to_index(self, col: Any, default_idx: int) -> int:
         if isinstance(col, int):
             return col
@@ -61,6 +91,7 @@ class SheetReader:
             # Open spreadsheet using the correct URL
             url_to_use = sheet_url or self.sheet_url
             self.spreadsheet = self.client.open_by_url(url_to_use)
+            self._worksheet = None
             
             return True
         except Exception as e:
@@ -73,24 +104,17 @@ class SheetReader:
             return []
         
         try:
-            worksheet = self.spreadsheet.worksheet(self._get_database_worksheet_name())
-            records = worksheet.get_all_records()
-
-            def _get_any(d: dict, *keys: str, default: Any = None) -> Any:
-                for k in keys:
-                    if k in d and d.get(k) not in (None, ""):
-                        return d.get(k)
-                return default
+            cols, rows = self._read_database()
 
             sheet_cfg = self.config.get("google_sheets") or {}
             done_value = str(sheet_cfg.get("status_done_value", "Done")).strip().lower()
 
             topics = set()
-            for record in records:
-                status_val = _get_any(record, 'STATUS', 'Status', 'status', default='')
+            for row in rows:
+                status_val = _cell(row, cols, 'STATUS', 'Status', 'status', default='')
                 if str(status_val).strip().lower() == done_value:
                     continue
-                cat = _get_any(record, 'CATEGORY', 'Category', 'Category ', 'category', default='')
+                cat = _cell(row, cols, 'CATEGORY', 'Category', 'Category ', 'category', default='')
                 cat = str(cat).strip()
                 if cat:
                     topics.add(cat)
@@ -110,19 +134,13 @@ class SheetReader:
             return []
         
         # Check cache first
-        if topic in self.cache:
-            return self.cache[topic]
+        hit = self.cache.get(topic)
+        if hit is not None and time.monotonic() - hit[0] < QUOTES_CACHE_TTL:
+            return hit[1]
 
         try:
-            worksheet = self.spreadsheet.worksheet(self._get_database_worksheet_name())
-            records = worksheet.get_all_records()
+            cols, rows = self._read_database()
              
-            def _get_any(d: dict, *keys: str, default: Any = None) -> Any:
-                for k in keys:
-                    if k in d and d.get(k) not in (None, ""):
-                        return d.get(k)
-                return default
-
             sheet_cfg = self.config.get("google_sheets") or {}
             max_len = sheet_cfg.get("max_length")
             english_only = bool(sheet_cfg.get("english_only"))
@@ -137,16 +155,16 @@ class SheetReader:
                     return False
 
             quotes = []
-            for idx, record in enumerate(records, start=2):
-                status_val = _get_any(record, 'STATUS', 'Status', 'status', default='')
+            for idx, row in enumerate(rows, start=2):
+                status_val = _cell(row, cols, 'STATUS', 'Status', 'status', default='')
                 if str(status_val).strip().lower() == done_value:
                     continue
 
-                cat = _get_any(record, 'CATEGORY', 'Category', 'Category ', 'category', default='')
+                cat = _cell(row, cols, 'CATEGORY', 'Category', 'Category ', 'category', default='')
                 if str(cat).strip() != str(topic).strip():
                     continue
 
-                length_val = _get_any(record, 'LENGTH', 'Length', 'length', default=None)
+                length_val = _cell(row, cols, 'LENGTH', 'Length', 'length', default=None)
                 try:
                     length_num = int(length_val) if length_val not in (None, "") else None
                 except Exception:
@@ -154,24 +172,24 @@ class SheetReader:
                 if isinstance(max_len, int) and length_num is not None and length_num > max_len:
                     continue
 
-                quote_text = _get_any(record, 'QUOTE', 'Quote', 'quote', default='')
+                quote_text = _cell(row, cols, 'QUOTE', 'Quote', 'quote', default='')
                 if quote_text:
                     if english_only and not _is_english(str(quote_text)):
                         continue
                     quotes.append({
                         'quote': quote_text,
-                        'translate': _get_any(record, 'TRANSLATE', 'Translate', 'translate', default=''),
-                        'author': _get_any(record, 'AUTHOR', 'Author', 'author', default='Unknown'),
-                        'category': _get_any(record, 'CATEGORY', 'Category', 'Category ', 'category', default=topic),
-                        'tags': _get_any(record, 'TAGS', 'Tags', 'tags', default=''),
-                        'image': _get_any(record, 'IMAGE', 'Image', 'image', default=''),
-                        'author_image': _get_any(record, 'IMAGE', 'Image', 'image', default=''),
+                        'translate': _cell(row, cols, 'TRANSLATE', 'Translate', 'translate', default=''),
+                        'author': _cell(row, cols, 'AUTHOR', 'Author', 'author', default='Unknown'),
+                        'category': _cell(row, cols, 'CATEGORY', 'Category', 'Category ', 'category', default=topic),
+                        'tags': _cell(row, cols, 'TAGS', 'Tags', 'tags', default=''),
+                        'image': _cell(row, cols, 'IMAGE', 'Image', 'image', default=''),
+                        'author_image': _cell(row, cols, 'IMAGE', 'Image', 'image', default=''),
                         'length': length_num,
                         '_row': idx,
                     })
             
             # Cache the results
-            self.cache[topic] = quotes
+            self.cache[topic] = (time.monotonic(), quotes)
             return quotes
             
         except Exception as e:
@@ -188,14 +206,7 @@ class SheetReader:
             return {"topic_total": 0, "authors": {}}
 
         try:
-            worksheet = self.spreadsheet.worksheet(self._get_database_worksheet_name())
-            records = worksheet.get_all_records()
-
-            def _get_any(d: dict, *keys: str, default: Any = None) -> Any:
-                for k in keys:
-                    if k in d and d.get(k) not in (None, ""):
-                        return d.get(k)
-                return default
+            cols, rows = self._read_database()
 
             sheet_cfg = self.config.get("google_sheets") or {}
             done_value = str(sheet_cfg.get("status_done_value", "Done")).strip().lower()
@@ -211,16 +222,16 @@ class SheetReader:
 
             topic_total = 0
             authors: dict[str, int] = {}
-            for record in records:
-                status_val = _get_any(record, 'STATUS', 'Status', 'status', default='')
+            for row in rows:
+                status_val = _cell(row, cols, 'STATUS', 'Status', 'status', default='')
                 if str(status_val).strip().lower() == done_value:
                     continue
 
-                cat = _get_any(record, 'CATEGORY', 'Category', 'Category ', 'category', default='')
+                cat = _cell(row, cols, 'CATEGORY', 'Category', 'Category ', 'category', default='')
                 if str(cat).strip() != str(topic).strip():
                     continue
 
-                length_val = _get_any(record, 'LENGTH', 'Length', 'length', default=None)
+                length_val = _cell(row, cols, 'LENGTH', 'Length', 'length', default=None)
                 try:
                     length_num = int(length_val) if length_val not in (None, "") else None
                 except Exception:
@@ -228,13 +239,13 @@ class SheetReader:
                 if isinstance(max_len, int) and length_num is not None and length_num > max_len:
                     continue
 
-                quote_text = _get_any(record, 'QUOTE', 'Quote', 'quote', default='')
+                quote_text = _cell(row, cols, 'QUOTE', 'Quote', 'quote', default='')
                 if not quote_text:
                     continue
                 if english_only and not _is_english(str(quote_text)):
                     continue
 
-                a = _get_any(record, 'AUTHOR', 'Author', 'author', default='Unknown')
+                a = _cell(row, cols, 'AUTHOR', 'Author', 'author', default='Unknown')
                 a = str(a).strip() or 'Unknown'
 
                 topic_total += 1
@@ -249,27 +260,40 @@ class SheetReader:
         """Backward-compatible alias used by scripts/dashboard.py"""
         return self.get_remaining_quotes(topic)
 
-    def mark_as_generated(self, topic: str, row: int, image_path: str) -> str:
-        """Mark quote as generated and update sheet"""
+    def mark_as_generated(self, topic: str, row: int, image_path: str,
+                          dimensions: Optional[str] = None, timestamp: Optional[str] = None) -> str:
+        """Mark quote as generated and update sheet (one batched write for K:N)"""
         if not self.spreadsheet:
             return "Failed: No spreadsheet connection"
 
         try:
-            worksheet = self.spreadsheet.worksheet(self._get_database_worksheet_name())
-
-            worksheet.update_cell(int(row), 11, f'=HYPERLINK("{image_path}","Preview Image")')
-            worksheet.update_cell(int(row), 12, "Done")
-            worksheet.update_cell(int(row), 13, "1080x1080")
-            ts = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            worksheet.update_cell(int(row), 14, ts)
+            worksheet = self._database_worksheet()
+
+            ts = timestamp or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            worksheet.batch_update([{
+                'range': f'K{int(row)}:N{int(row)}',
+                'values': [[
+                    f'=HYPERLINK("{image_path}","Preview Image")',
+                    "Done",
+                    str(dimensions or "1080x1080"),
+                    str(ts),
+                ]],
+            }], value_input_option="USER_ENTERED")
+
+            # Row is Done now; drop it from the cached list so the next job can't pick it again
+            hit = self.cache.get(topic)
+            if hit is not None:
+                self.cache[topic] = (hit[0], [q for q in hit[1] if q.get('_row') != int(row)])
 
             return f"Successfully updated row {row}"
         except Exception as e:
             return f"Error updating sheet: {e}"
 
-    def write_back(self, topic: str, row: int, image_url: str) -> bool:
+    def write_back(self, topic: str, row: int, image_url: str,
+                   dimensions: Optional[str] = None, timestamp: Optional[str] = None) -> bool:
         """Write preview link + mark Done (compat for dashboard)."""
-        res = self.mark_as_generated(topic=topic, row=row, image_path=image_url)
+        res = self.mark_as_generated(topic=topic, row=row, image_path=image_url,
+                                     dimensions=dimensions, timestamp=timestamp)
         return str(res).lower().startswith("successfully")
 
     def write_generation_meta(self, row: int, dimensions: str, timestamp: str) -> bool:
@@ -277,11 +301,14 @@ class SheetReader:
         if not self.spreadsheet:
             return False
         try:
-            worksheet = self.spreadsheet.worksheet(self._get_database_worksheet_name())
+            worksheet = self._database_worksheet()
+            updates = []
             if dimensions is not None:
-                worksheet.update_cell(int(row), 13, str(dimensions))
+                updates.append({'range': f'M{int(row)}', 'values': [[str(dimensions)]]})
             if timestamp is not None:
-                worksheet.update_cell(int(row), 14, str(timestamp))
+                updates.append({'range': f'N{int(row)}', 'values': [[str(timestamp)]]})
+            if updates:
+                worksheet.batch_update(updates, value_input_option="USER_ENTERED")
             return True
         except Exception as e:
             print(f"Error writing generation meta: {e}")
@@ -291,7 +318,7 @@ class SheetReader:
         if not self.spreadsheet:
             return False
         try:
-            worksheet = self.spreadsheet.worksheet(self._get_database_worksheet_name())
+            worksheet = self._database_worksheet()
             # Column layout used by unified app push:
             # SNO, LENGTH, CATEGORY, AUTHOR, QUOTE, TRANSLATE, ...
             worksheet.update_cell(int(row), 6, str(translated_text or ''))
@@ -0,0 +1,12 @@
+"""
+WSGI entry point for running QuoteMaster under a production server, e.g.
+
+    gunicorn -k gthread -w 1 --threads 16 -b 0.0.0.0:8000 wsgi:app
+
+Keep a single worker process: job progress lives in that process's memory
+(see JobStore in app.py). Concurrency comes from the worker's threads.
+"""
+
+from app import app
+
+__all__ = ["app"]